@@ -26,11 +26,16 @@ setup(
         "click>=8.1.7",
         "rich>=13.7.0",
         "anthropic>=0.39.0",
+        "pybase64>=1.3.0",
         "Pillow>=10.4.0",
         "ffmpeg-python>=0.2.0",
         "python-dotenv>=1.0.0",
         "pydantic>=2.10.0",
     ],
+    extras_require={
+        # In-process frame decoding instead of one ffmpeg process per call
+        "av": ["av>=12.0.0"],
+    },
     entry_points={
         "console_scripts": [
             "autothumb=autothumb.cli.main:cli",
@@ -2,8 +2,9 @@
 
 import os
 import sys
+import asyncio
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 import click
 from rich.console import Console
@@ -12,26 +13,95 @@ from rich.panel import Panel
 from rich.table import Table
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Core modules (anthropic, Pillow) are imported inside the commands that
+# need them, so `--help`, `info` and `styles` start quickly.
 
-from autothumb.core.video import VideoProcessor
-from autothumb.core.analyzer import FrameAnalyzer
-from autothumb.core.composer import ThumbnailComposer
+console = Console()
 
 
-console = Console()
+def _get_analyzer(ctx: click.Context, use_cache: bool = True, analyze_model: Optional[str] = None):
+    """
+    Get a FrameAnalyzer shared through the click context.
+
+    Reusing the analyzer keeps its Anthropic connection pool alive across
+    the requests of a command (e.g. every video of a batch). It is closed
+    when the command ends, see _close_async().
+
+    Args:
+        ctx: Click context
+        use_cache: Reuse cached Claude results
+        analyze_model: Claude model used to rank frames
+
+    Returns:
+        FrameAnalyzer instance
+    """
+    from autothumb.core.analyzer import FrameAnalyzer
+
+    key = ("analyzer", use_cache, analyze_model)
+    if key not in ctx.obj:
+        ctx.obj[key] = FrameAnalyzer(use_cache=use_cache, analyze_model=analyze_model)
+
+    return ctx.obj[key]
+
+
+def _run_async(ctx: click.Context, coro):
+    """
+    Run a coroutine on the event loop shared through the click context.
+
+    The shared analyzer's async HTTP connections belong to the loop they were
+    opened on, so every command reuses the same loop instead of asyncio.run.
+
+    Args:
+        ctx: Click context
+        coro: Coroutine to run
+
+    Returns:
+        Coroutine result
+    """
+    if "runner" not in ctx.obj:
+        ctx.obj["runner"] = asyncio.Runner()
+        ctx.call_on_close(lambda: _close_async(ctx.obj))
+
+    return ctx.obj["runner"].run(coro)
+
+
+def _close_async(obj: Dict):
+    """
+    Close the shared analyzers' HTTP clients, then their event loop.
+
+    Registered on the command context by _run_async(). The entries are
+    removed from the context object, so a later command run with the same
+    object starts with a fresh loop and analyzer.
+
+    Args:
+        obj: Click context object
+    """
+    runner = obj.pop("runner", None)
+    analyzers = [
+        obj.pop(key) for key in list(obj)
+        if isinstance(key, tuple) and key[0] == "analyzer"
+    ]
+
+    if runner is None:
+        return
+
+    try:
+        for analyzer in analyzers:
+            runner.run(analyzer.aclose())
+    finally:
+        runner.close()
 
 
 @click.group()
 @click.version_option(version="0.1.0")
-def cli():
+@click.pass_context
+def cli(ctx: click.Context):
     """
     AutoThumb - Générateur automatique de thumbnails YouTube avec IA
 
     Utilisez Claude Vision pour analyser vos vidéos et créer des thumbnails optimisées.
     """
-    pass
+    ctx.ensure_object(dict)
 
 
 @cli.command()
@@ -64,13 +134,33 @@ def cli():
     default=10,
     help="Nombre de frames à analyser"
 )
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Ignore les résultats d'analyse en cache"
+)
+@click.option(
+    "--contact-sheet",
+    is_flag=True,
+    help="Envoie les frames en une seule planche contact (moins de tokens)"
+)
+@click.option(
+    "--analyze-model",
+    default=None,
+    help="Modèle Claude pour classer les frames (défaut: claude-3-5-haiku-latest)"
+)
+@click.pass_context
 def generate(
+    ctx: click.Context,
     video_path: str,
     prompt: str,
     output: Optional[str],
     style: str,
     resolution: str,
-    frames: int
+    frames: int,
+    no_cache: bool,
+    contact_sheet: bool,
+    analyze_model: Optional[str]
 ):
     """
     Génère un thumbnail complet : extraction, analyse IA, composition.
@@ -80,6 +170,11 @@ def generate(
     Example:
         autothumb generate video.mp4 -p "Tutoriel Python" -s youtube
     """
+    from autothumb.core.video import VideoProcessor
+    from autothumb.core.composer import ThumbnailComposer
+
+    load_dotenv()
+
     # Set default output
     if not output:
         output = "./output/thumbnail.jpg"
@@ -109,41 +204,43 @@ def generate(
             # Step 1: Extract frames
             task1 = progress.add_task("[cyan]Extraction des frames...", total=1)
 
-            processor = VideoProcessor(video_path)
-            video_width = processor.metadata['width']
-            video_height = processor.metadata['height']
-
-            console.print(f"\n[green]✓[/green] Vidéo chargée: {processor.metadata['duration']:.1f}s, "
-                         f"{video_width}x{video_height}")
-
-            # Detect video format and adjust thumbnail resolution
-            is_vertical = video_height > video_width
-            if is_vertical:
-                # For vertical videos (shorts), swap width and height
-                target_resolution = (base_resolution[1], base_resolution[0])
-                console.print(f"[cyan]ℹ[/cyan] Format vertical détecté, thumbnail: {target_resolution[0]}x{target_resolution[1]}")
-            else:
-                # For horizontal videos, use base resolution
-                target_resolution = base_resolution
-                console.print(f"[cyan]ℹ[/cyan] Format horizontal détecté, thumbnail: {target_resolution[0]}x{target_resolution[1]}")
-
-            # Extract to a persistent directory, not temp
-            frame_output_dir = os.path.join(os.path.dirname(output), "frames_temp")
-            frame_paths = processor.extract_frames(num_frames=frames, output_dir=frame_output_dir)
-            console.print(f"[green]✓[/green] {len(frame_paths)} frames extraites")
+            # Released as soon as the frames are on disk (closes the decoder)
+            with VideoProcessor(video_path) as processor:
+                video_width = processor.metadata['width']
+                video_height = processor.metadata['height']
+
+                console.print(f"\n[green]✓[/green] Vidéo chargée: {processor.metadata['duration']:.1f}s, "
+                             f"{video_width}x{video_height}")
+
+                # Detect video format and adjust thumbnail resolution
+                is_vertical = video_height > video_width
+                if is_vertical:
+                    # For vertical videos (shorts), swap width and height
+                    target_resolution = (base_resolution[1], base_resolution[0])
+                    console.print(f"[cyan]ℹ[/cyan] Format vertical détecté, thumbnail: {target_resolution[0]}x{target_resolution[1]}")
+                else:
+                    # For horizontal videos, use base resolution
+                    target_resolution = base_resolution
+                    console.print(f"[cyan]ℹ[/cyan] Format horizontal détecté, thumbnail: {target_resolution[0]}x{target_resolution[1]}")
+
+                # Extract to a persistent directory, not temp
+                frame_output_dir = os.path.join(os.path.dirname(output), "frames_temp")
+                frame_paths = processor.extract_frames(num_frames=frames, output_dir=frame_output_dir)
+                console.print(f"[green]✓[/green] {len(frame_paths)} frames extraites")
 
             progress.update(task1, completed=1)
 
             # Step 2: Analyze with Claude Vision
             task2 = progress.add_task("[cyan]Analyse IA avec Claude Vision...", total=1)
 
-            analyzer = FrameAnalyzer()
-            frame_analysis, text_result = analyzer.analyze_and_generate(
+            analyzer = _get_analyzer(ctx, use_cache=not no_cache, analyze_model=analyze_model)
+            frame_analysis, text_result = _run_async(ctx, analyzer.analyze_and_generate(
                 frame_paths,
                 prompt,
                 style=style,
-                max_words=6
-            )
+                max_words=6,
+                contact_sheet=contact_sheet
+            ))
 
             console.print(f"\n[green]✓[/green] Meilleure frame sélectionnée: "
                          f"#{frame_analysis['best_frame_index'] + 1}")
@@ -208,7 +305,32 @@ def generate(
     default="./output/frames",
     help="Dossier pour sauvegarder les frames"
 )
-def analyze(video_path: str, prompt: str, frames: int, output_dir: str):
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Ignore les résultats d'analyse en cache"
+)
+@click.option(
+    "--contact-sheet",
+    is_flag=True,
+    help="Envoie les frames en une seule planche contact (moins de tokens)"
+)
+@click.option(
+    "--analyze-model",
+    default=None,
+    help="Modèle Claude pour classer les frames (défaut: claude-3-5-haiku-latest)"
+)
+@click.pass_context
+def analyze(
+    ctx: click.Context,
+    video_path: str,
+    prompt: str,
+    frames: int,
+    output_dir: str,
+    no_cache: bool,
+    contact_sheet: bool,
+    analyze_model: Optional[str]
+):
     """
     Analyse une vidéo et recommande la meilleure frame + texte.
 
@@ -217,6 +339,10 @@ def analyze(video_path: str, prompt: str, frames: int, output_dir: str):
     Example:
         autothumb analyze video.mp4 -p "DevOps Tutorial" -f 15
     """
+    from autothumb.core.video import VideoProcessor
+
+    load_dotenv()
+
     console.print(Panel.fit(
         f"[bold cyan]AutoThumb - Analyse de Vidéo[/bold cyan]\n\n"
         f"[yellow]Vidéo:[/yellow] {video_path}\n"
@@ -237,13 +363,14 @@ def analyze(video_path: str, prompt: str, frames: int, output_dir: str):
         # Analyze with Claude
         console.print("\n[cyan]→[/cyan] Analyse avec Claude Vision...")
 
-        analyzer = FrameAnalyzer()
-        frame_analysis, text_result = analyzer.analyze_and_generate(
+        analyzer = _get_analyzer(ctx, use_cache=not no_cache, analyze_model=analyze_model)
+        frame_analysis, text_result = _run_async(ctx, analyzer.analyze_and_generate(
             frame_paths,
             prompt,
             style="youtube",
-            max_words=6
-        )
+            max_words=6,
+            contact_sheet=contact_sheet
+        ))
 
         # Display results
         console.print("\n[bold green]✓ Analyse terminée![/bold green]\n")
@@ -272,6 +399,289 @@ def analyze(video_path: str, prompt: str, frames: int, output_dir: str):
         sys.exit(1)
 
 
+VIDEO_EXTENSIONS = (".mp4", ".mov", ".mkv", ".avi", ".webm")
+
+
+def _thumbnail_names(video_paths: List[Path]) -> List[str]:
+    """
+    Pick a distinct thumbnail file name for each video of a batch.
+
+    Videos are named after their stem; stems shared by several inputs
+    (a.mp4 and a.mov, or same name in different folders) get the extension
+    and, if still taken, a counter appended.
+
+    Args:
+        video_paths: Videos to process
+
+    Returns:
+        File names, in the same order as video_paths
+    """
+    stem_counts: Dict[str, int] = {}
+    for path in video_paths:
+        stem_counts[path.stem] = stem_counts.get(path.stem, 0) + 1
+
+    names = []
+    used = set()
+    for path in video_paths:
+        base = path.stem
+        if stem_counts[base] > 1 and path.suffix:
+            base = f"{base}_{path.suffix[1:].lower()}"
+
+        name = base
+        counter = 2
+        while name in used:
+            name = f"{base}_{counter}"
+            counter += 1
+
+        used.add(name)
+        names.append(f"{name}_thumbnail.jpg")
+
+    return names
+
+
+async def _run_batch(
+    analyzer,
+    video_paths: List[Path],
+    prompt: Optional[str],
+    output_dir: Path,
+    style: str,
+    base_resolution: Tuple[int, int],
+    frames: int,
+    contact_sheet: bool
+) -> List[Tuple[Path, Optional[str], Optional[str]]]:
+    """
+    Process videos through an extract → analyze → compose pipeline.
+
+    Each stage runs concurrently on a different video: ffmpeg extracts the
+    next video while Claude analyzes the current one and Pillow composes the
+    previous one. Bounded queues keep at most a couple of videos' frames on
+    disk ahead of the slowest stage.
+
+    Args:
+        analyzer: FrameAnalyzer instance
+        video_paths: Videos to process
+        prompt: Shared video description (defaults to each file name)
+        output_dir: Directory for thumbnails (frames go to a private temp dir)
+        style: Thumbnail style
+        base_resolution: Thumbnail resolution for horizontal videos
+        frames: Number of frames to analyze per video
+        contact_sheet: Send frames as a single contact sheet
+
+    Returns:
+        List of (video_path, thumbnail_path, error) in completion order
+    """
+    import shutil
+    import tempfile
+    from autothumb.core.video import VideoProcessor
+    from autothumb.core.composer import ThumbnailComposer
+
+    loop = asyncio.get_running_loop()
+    extracted: asyncio.Queue = asyncio.Queue(maxsize=2)
+    analyzed: asyncio.Queue = asyncio.Queue(maxsize=2)
+    composer = ThumbnailComposer(style=style)
+    output_names = _thumbnail_names(video_paths)
+    frames_root = Path(tempfile.mkdtemp(prefix="autothumb_batch_"))
+    results = []
+
+    def extract(index: int, video_path: Path):
+        with VideoProcessor(str(video_path)) as processor:
+            width = processor.metadata['width']
+            height = processor.metadata['height']
+            frame_dir = frames_root / f"{index:04d}"
+            frame_paths = processor.extract_frames(num_frames=frames, output_dir=str(frame_dir))
+
+        # Vertical videos (shorts) get a vertical thumbnail
+        if height > width:
+            resolution = (base_resolution[1], base_resolution[0])
+        else:
+            resolution = base_resolution
+
+        return frame_dir, frame_paths, resolution
+
+    def compose(frame_analysis: Dict, text_result: Dict, output_path: Path, resolution):
+        return composer.create_thumbnail_from_analysis(
+            frame_analysis['best_frame_path'],
+            text_result,
+            str(output_path),
+            resolution=resolution
+        )
+
+    async def extract_stage():
+        for index, video_path in enumerate(video_paths):
+            try:
+                item = await loop.run_in_executor(None, extract, index, video_path)
+            except Exception as e:
+                results.append((video_path, None, str(e)))
+                continue
+            await extracted.put((index, video_path, *item))
+        await extracted.put(None)
+
+    async def analyze_stage():
+        while (item := await extracted.get()) is not None:
+            index, video_path, frame_dir, frame_paths, resolution = item
+            description = prompt or video_path.stem.replace("_", " ").replace("-", " ")
+            try:
+                frame_analysis, text_result = await analyzer.analyze_and_generate(
+                    frame_paths,
+                    description,
+                    style=style,
+                    max_words=6,
+                    contact_sheet=contact_sheet
+                )
+            except Exception as e:
+                shutil.rmtree(frame_dir, ignore_errors=True)
+                results.append((video_path, None, str(e)))
+                continue
+            await analyzed.put((index, video_path, frame_dir, frame_analysis, text_result, resolution))
+        await analyzed.put(None)
+
+    async def compose_stage():
+        while (item := await analyzed.get()) is not None:
+            index, video_path, frame_dir, frame_analysis, text_result, resolution = item
+            output_path = output_dir / output_names[index]
+            try:
+                final_path = await loop.run_in_executor(
+                    None, compose, frame_analysis, text_result, output_path, resolution
+                )
+            except Exception as e:
+                results.append((video_path, None, str(e)))
+            else:
+                results.append((video_path, final_path, None))
+                console.print(f"[green]✓[/green] {video_path.name} → {final_path}")
+            finally:
+                shutil.rmtree(frame_dir, ignore_errors=True)
+
+    try:
+        await asyncio.gather(extract_stage(), analyze_stage(), compose_stage())
+    finally:
+        shutil.rmtree(frames_root, ignore_errors=True)
+
+    return results
+
+
+@cli.command()
+@click.argument("directory", type=click.Path(exists=True, file_okay=False))
+@click.option(
+    "--prompt", "-p",
+    help="Description commune du contenu (défaut: nom du fichier)"
+)
+@click.option(
+    "--output-dir", "-o",
+    type=click.Path(),
+    default="./output",
+    help="Dossier de sortie des thumbnails"
+)
+@click.option(
+    "--style", "-s",
+    type=click.Choice(["youtube", "minimalist", "bold", "tech"]),
+    default="youtube",
+    help="Style du thumbnail"
+)
+@click.option(
+    "--resolution", "-r",
+    type=click.Choice(["720p", "1080p"]),
+    default="720p",
+    help="Résolution du thumbnail"
+)
+@click.option(
+    "--frames", "-f",
+    type=int,
+    default=10,
+    help="Nombre de frames à analyser par vidéo"
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Ignore les résultats d'analyse en cache"
+)
+@click.option(
+    "--contact-sheet",
+    is_flag=True,
+    help="Envoie les frames en une seule planche contact (moins de tokens)"
+)
+@click.option(
+    "--analyze-model",
+    default=None,
+    help="Modèle Claude pour classer les frames (défaut: claude-3-5-haiku-latest)"
+)
+@click.pass_context
+def batch(
+    ctx: click.Context,
+    directory: str,
+    prompt: Optional[str],
+    output_dir: str,
+    style: str,
+    resolution: str,
+    frames: int,
+    no_cache: bool,
+    contact_sheet: bool,
+    analyze_model: Optional[str]
+):
+    """
+    Génère un thumbnail pour chaque vidéo d'un dossier.
+
+    L'extraction, l'analyse IA et la composition s'exécutent en pipeline :
+    chaque étape traite une vidéo différente en parallèle.
+
+    Example:
+        autothumb batch ./videos -s bold -o ./thumbnails
+    """
+    load_dotenv()
+
+    video_paths = sorted(
+        path for path in Path(directory).iterdir()
+        if path.is_file() and path.suffix.lower() in VIDEO_EXTENSIONS
+    )
+    if not video_paths:
+        console.print(f"[bold red]✗ Erreur:[/bold red] Aucune vidéo trouvée dans {directory}", style="red")
+        sys.exit(1)
+
+    res_map = {"720p": (1280, 720), "1080p": (1920, 1080)}
+
+    console.print(Panel.fit(
+        f"[bold cyan]AutoThumb - Mode Batch[/bold cyan]\n\n"
+        f"[yellow]Dossier:[/yellow] {directory}\n"
+        f"[yellow]Vidéos:[/yellow] {len(video_paths)}\n"
+        f"[yellow]Style:[/yellow] {style}\n"
+        f"[yellow]Résolution:[/yellow] {resolution}\n"
+        f"[yellow]Frames à analyser:[/yellow] {frames}",
+        border_style="cyan"
+    ))
+
+    analyzer = _get_analyzer(ctx, use_cache=not no_cache, analyze_model=analyze_model)
+    results = _run_async(ctx, _run_batch(
+        analyzer,
+        video_paths,
+        prompt,
+        Path(output_dir),
+        style,
+        res_map[resolution],
+        frames,
+        contact_sheet
+    ))
+
+    table = Table(title="Résultats du Batch", show_header=True, header_style="bold magenta")
+    table.add_column("Vidéo", style="cyan")
+    table.add_column("Résultat", style="yellow")
+
+    failures = 0
+    for video_path, final_path, error in results:
+        if error:
+            failures += 1
+            table.add_row(video_path.name, f"[red]✗ {error}[/red]")
+        else:
+            table.add_row(video_path.name, final_path)
+
+    console.print()
+    console.print(table)
+
+    if failures:
+        console.print(f"\n[bold red]✗ {failures}/{len(video_paths)} vidéo(s) en échec[/bold red]")
+        sys.exit(1)
+
+    console.print(f"\n[bold green]✓ {len(video_paths)} thumbnails générés avec succès![/bold green]")
+
+
 @cli.command()
 @click.argument("image_path", type=click.Path(exists=True))
 @click.option(
@@ -317,6 +727,8 @@ def compose(
     Example:
         autothumb compose frame.jpg -t "Python Tips" --subtext "2024" -s bold
     """
+    from autothumb.core.composer import ThumbnailComposer
+
     res_map = {"720p": (1280, 720), "1080p": (1920, 1080)}
     target_resolution = res_map[resolution]
 
@@ -358,6 +770,8 @@ def info(video_path: str):
     Example:
         autothumb info video.mp4
     """
+    from autothumb.core.video import VideoProcessor
+
     try:
         processor = VideoProcessor(video_path)
         meta = processor.metadata
@@ -387,6 +801,8 @@ def styles():
     """
     Affiche les styles de thumbnail disponibles.
     """
+    from autothumb.core.composer import ThumbnailComposer
+
     console.print("\n[bold cyan]Styles de Thumbnail Disponibles[/bold cyan]\n")
 
     for style_name, style_config in ThumbnailComposer.STYLES.items():
@@ -1,22 +1,278 @@
 """Module for analyzing video frames using Claude Vision API."""
 
+import io
 import os
-import base64
+import asyncio
+import json
+import mmap
+import random
+import functools
+from string import Template
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional, Tuple
-from pathlib import Path
 import anthropic
-from anthropic import Anthropic
+from anthropic import AsyncAnthropic
+from PIL import Image, ImageDraw, ImageFont
+
+from autothumb.utils.cache import ResponseCache
+
+try:
+    # Raised as-is (not wrapped by the SDK) when a stream breaks mid-body
+    from httpx import TransportError
+except ImportError:
+    # anthropic releases built on httpx2
+    from httpx2 import TransportError
+
+try:
+    # SIMD-accelerated base64 (SSSE3/AVX2/NEON)
+    from pybase64 import b64encode
+except ImportError:
+    from base64 import standard_b64encode as b64encode
+
+
+# Frame ranking is a coarse visual task: a small fast model is enough.
+# Text generation is short but creative and gets the stronger model.
+DEFAULT_ANALYZE_MODEL = "claude-3-5-haiku-latest"
+DEFAULT_TEXT_MODEL = "claude-3-5-sonnet-latest"
+
+# Fail fast on connect, but leave room for long vision responses
+REQUEST_TIMEOUT = anthropic.Timeout(60.0, connect=5.0)
+
+# The SDK retries failed requests (429, 5xx, 529 overloaded, connection
+# errors) with exponential backoff; errors and dropped connections
+# mid-stream are retried by _create_message with the same budget
+MAX_RETRIES = 3
+RETRY_BASE_DELAY = 1.0
+_RETRYABLE_ERROR_TYPES = {"overloaded_error", "rate_limit_error", "api_error"}
+
+# Frames are downscaled to this size (longest side, in pixels) before upload
+MAX_IMAGE_SIZE = 768
+JPEG_QUALITY = 80
+
+# Image formats accepted by Claude Vision, by file extension
+_MEDIA_TYPES = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+}
+
+# Contact sheet layout: frames are tiled in a grid of this many columns
+CONTACT_SHEET_COLUMNS = 4
+CONTACT_SHEET_TILE_SIZE = (256, 144)
+
+# Default criteria for frame selection
+DEFAULT_CRITERIA = {
+    "visual_appeal": "Clear, well-lit, and visually engaging",
+    "composition": "Good framing and subject positioning",
+    "text_overlay": "Space for text overlay without obscuring key elements",
+    "engagement": "Likely to attract clicks and viewer interest",
+    "clarity": "Sharp focus, not blurry or transitional",
+}
+
+# Tone guidelines for generated thumbnail text
+STYLE_GUIDELINES = {
+    "youtube": "Engaging, attention-grabbing, uses power words, creates curiosity",
+    "minimalist": "Clean, simple, direct, 2-3 words max",
+    "bold": "Strong, impactful, uses action verbs and emotion",
+    "tech": "Professional, technical, clear value proposition",
+    "clickbait": "Extremely attention-grabbing, uses numbers, urgency, curiosity gaps"
+}
+
+_ANALYZE_PROMPT = Template("""You are an expert at analyzing video frames to select the best thumbnail image for YouTube videos.
+
+Video Description: $video_description
+
+$frames_intro Please analyze each frame based on these criteria:
+$criteria_text
+
+For each frame, provide:
+1. A score from 1-10
+2. Brief assessment of strengths and weaknesses
+3. Suitability for thumbnail with text overlay
+
+Finally, recommend which frame would make the best thumbnail and explain why.
+
+Format your response as JSON with this structure:
+{
+    "frames": [
+        {
+            "index": 0,
+            "score": 8,
+            "strengths": ["clear subject", "good lighting"],
+            "weaknesses": ["slightly off-center"],
+            "thumbnail_suitability": "Good space for text overlay at top"
+        },
+        ...
+    ],
+    "best_frame_index": 3,
+    "reasoning": "Frame 3 is the best choice because..."
+}""")
+
+_TEXT_PROMPT = Template("""You are an expert at creating catchy, effective thumbnail text for YouTube videos.
+
+Video Description: $video_description
+
+Style: $style
+Style Guidelines: $style_guide
+Maximum Words: $max_words
+
+Create compelling thumbnail text that will:
+1. Grab attention immediately
+2. Clearly communicate the video's value
+3. Encourage clicks without being misleading
+4. Work well visually when overlaid on an image
+
+Provide:
+- Main text (large, primary text - max $max_words words)
+- Optional subtext (smaller supporting text - 1-3 words)
+- Brief reasoning for your choices
+
+Format as JSON:
+{
+    "main_text": "YOUR MAIN TEXT HERE",
+    "subtext": "optional subtext",
+    "reasoning": "why this text is effective..."
+}""")
+
+# Multiple of 3 so each chunk base64-encodes without padding
+_B64_CHUNK_SIZE = 57 * 1024
+
+
+@functools.lru_cache(maxsize=32)
+def _format_criteria(criteria: Tuple[Tuple[str, str], ...]) -> str:
+    """
+    Format selection criteria as a bullet list for the analysis prompt.
+
+    Args:
+        criteria: (name, description) pairs, hashable for caching
+
+    Returns:
+        Criteria text, one "- name: description" line per criterion
+    """
+    return "\n".join(f"- {name}: {description}" for name, description in criteria)
+
+
+def _b64encode_buffer(data) -> str:
+    """
+    Base64-encode a bytes-like object chunk by chunk.
+
+    Slicing a memoryview does not copy, so only the encoded output is
+    allocated in addition to the source buffer.
+
+    Args:
+        data: Bytes-like object (bytes, memoryview, mmap...)
+
+    Returns:
+        Base64 encoded string
+    """
+    view = memoryview(data)
+    encoded = bytearray()
+    for start in range(0, len(view), _B64_CHUNK_SIZE):
+        encoded += b64encode(view[start:start + _B64_CHUNK_SIZE])
+    view.release()
+
+    return encoded.decode("ascii")
+
+
+def _is_retryable(error: anthropic.APIError) -> bool:
+    """
+    Check whether an API error is transient.
+
+    Args:
+        error: Error raised by the Anthropic client
+
+    Returns:
+        True for connection errors, rate limits and server-side errors
+    """
+    if isinstance(error, anthropic.APIConnectionError):
+        return True
+
+    if error.status_code == 429 or error.status_code >= 500:
+        return True
+
+    # Errors sent as stream events arrive with the 200 status of the stream
+    body = error.body if isinstance(error.body, dict) else {}
+    error_type = (body.get("error") or {}).get("type")
+    return error_type in _RETRYABLE_ERROR_TYPES
+
+
+def _extract_json(text: str) -> Optional[Dict]:
+    """
+    Extract the first JSON object embedded in a Claude response.
+
+    Scans forward from each opening brace, tracking nesting depth and
+    skipping string literals, so braces in surrounding prose or inside JSON
+    strings don't break the match. Runs in linear time for well-formed
+    responses, unlike a backtracking regex.
+
+    Args:
+        text: Response text, possibly with prose around the JSON
+
+    Returns:
+        Parsed JSON object, or None if no valid object is found
+    """
+    start = text.find("{")
+
+    while start != -1:
+        depth = 0
+        in_string = False
+        escaped = False
+
+        for i in range(start, len(text)):
+            char = text[i]
+
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif char == "\\":
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = True
+            elif char == "{":
+                depth += 1
+            elif char == "}":
+                depth -= 1
+                if depth == 0:
+                    try:
+                        value = json.loads(text[start:i + 1])
+                    except json.JSONDecodeError:
+                        break
+                    if isinstance(value, dict):
+                        return value
+                    break
+
+        # Not a valid object: retry from the next opening brace
+        start = text.find("{", start + 1)
+
+    return None
 
 
 class FrameAnalyzer:
     """Analyze video frames using Claude Vision to select the best thumbnail."""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        use_cache: bool = True,
+        cache_dir: Optional[str] = None,
+        analyze_model: Optional[str] = None,
+        text_model: Optional[str] = None,
+        max_retries: int = MAX_RETRIES
+    ):
         """
         Initialize the frame analyzer.
 
         Args:
             api_key: Anthropic API key (reads from ANTHROPIC_API_KEY env var if None)
+            use_cache: Reuse previous results for identical frames and prompts
+            cache_dir: Directory for cached results (defaults to ~/.cache/autothumb)
+            analyze_model: Claude model used to rank frames (defaults to Haiku)
+            text_model: Claude model used to write thumbnail text (defaults to Sonnet)
+            max_retries: Retries for transient API errors (rate limits, overload)
 
         Raises:
             ValueError: If no API key is provided or found in environment
@@ -28,46 +284,210 @@ class FrameAnalyzer:
                 "Provide via api_key parameter or ANTHROPIC_API_KEY environment variable."
             )
 
-        self.client = Anthropic(api_key=self.api_key)
+        self.analyze_model = analyze_model or DEFAULT_ANALYZE_MODEL
+        self.text_model = text_model or DEFAULT_TEXT_MODEL
+        self.max_retries = max_retries
+        # One client per analyzer: its connection pool keeps TCP/TLS sessions
+        # alive between calls instead of reconnecting for every request
+        self.client = AsyncAnthropic(
+            api_key=self.api_key,
+            timeout=REQUEST_TIMEOUT,
+            max_retries=max_retries
+        )
+        self.cache = ResponseCache(cache_dir) if use_cache else None
+
+    async def aclose(self):
+        """Close the underlying HTTP connection pool."""
+        await self.client.close()
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit - close HTTP connections."""
+        await self.aclose()
+
+    async def _create_message(self, **kwargs) -> str:
+        """
+        Send a request to Claude and collect the streamed response text.
+
+        Streaming lets the response be assembled while the model is still
+        generating, instead of waiting for the whole body.
+
+        The client already retries requests that fail before the stream
+        opens; an overload error event or a dropped connection (read error,
+        timeout, protocol error) after that point is retried here with
+        exponential backoff and jitter.
+
+        Args:
+            **kwargs: Arguments for messages.stream (model, max_tokens, messages)
 
-    def _encode_image(self, image_path: str) -> str:
+        Returns:
+            Full response text
+        """
+        for attempt in range(self.max_retries + 1):
+            chunks = []
+            streaming = False
+            try:
+                async with self.client.messages.stream(**kwargs) as stream:
+                    streaming = True
+                    async for text in stream.text_stream:
+                        chunks.append(text)
+                return "".join(chunks)
+            except (anthropic.APIConnectionError, anthropic.APIStatusError) as e:
+                if not streaming or attempt == self.max_retries or not _is_retryable(e):
+                    raise
+            except TransportError:
+                # The SDK only wraps transport errors raised before the
+                # stream opens; once reading the body they surface raw
+                if not streaming or attempt == self.max_retries:
+                    raise
+            await asyncio.sleep(RETRY_BASE_DELAY * 2 ** attempt + random.random())
+
+    def _open_frame(self, image_path: str) -> Image.Image:
         """
-        Encode image to base64 string.
+        Open a frame image.
 
         Args:
             image_path: Path to image file
 
         Returns:
-            Base64 encoded image string
+            Opened (lazily loaded) image
+
+        Raises:
+            FileNotFoundError: If the frame doesn't exist
         """
-        with open(image_path, "rb") as image_file:
-            return base64.standard_b64encode(image_file.read()).decode("utf-8")
+        try:
+            return Image.open(image_path)
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Frame not found: {image_path}") from e
 
-    def _get_image_media_type(self, image_path: str) -> str:
+    def _encode_image(self, image_path: str) -> Tuple[str, str]:
         """
-        Get media type from image file extension.
+        Downscale and re-encode image as JPEG, then encode it to base64.
+
+        Claude bills vision input per pixel, so full resolution frames are
+        shrunk to MAX_IMAGE_SIZE on their longest side before upload. Files
+        that already fit, in a format Claude accepts, are sent as-is straight
+        from a memory map.
 
         Args:
             image_path: Path to image file
 
         Returns:
-            Media type string (e.g., 'image/jpeg')
+            Tuple of (base64 encoded image, media type)
         """
-        ext = Path(image_path).suffix.lower()
-        media_types = {
-            ".jpg": "image/jpeg",
-            ".jpeg": "image/jpeg",
-            ".png": "image/png",
-            ".gif": "image/gif",
-            ".webp": "image/webp",
+        media_type = _MEDIA_TYPES.get(image_path[image_path.rfind("."):].lower())
+
+        with self._open_frame(image_path) as image:
+            # Image.open only reads the header, so this check is cheap
+            if media_type and max(image.size) <= MAX_IMAGE_SIZE:
+                with open(image_path, "rb") as f:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        return _b64encode_buffer(mapped), media_type
+
+            image.thumbnail((MAX_IMAGE_SIZE, MAX_IMAGE_SIZE), Image.Resampling.LANCZOS)
+            buffer = io.BytesIO()
+            image.convert("RGB").save(buffer, "JPEG", quality=JPEG_QUALITY, optimize=True)
+
+        return _b64encode_buffer(buffer.getbuffer()), "image/jpeg"
+
+    def _build_contact_sheet(self, frame_paths: List[str]) -> Tuple[str, str]:
+        """
+        Tile all frames into a single labelled JPEG contact sheet.
+
+        Each tile is labelled with its frame index, in reading order.
+
+        Args:
+            frame_paths: Paths to frame images
+
+        Returns:
+            Tuple of (base64 encoded JPEG contact sheet, media type)
+        """
+        tile_width, tile_height = CONTACT_SHEET_TILE_SIZE
+        columns = min(CONTACT_SHEET_COLUMNS, len(frame_paths))
+        rows = -(-len(frame_paths) // columns)
+
+        sheet = Image.new("RGB", (columns * tile_width, rows * tile_height))
+        draw = ImageDraw.Draw(sheet)
+        font = ImageFont.load_default(size=24)
+
+        for index, frame_path in enumerate(frame_paths):
+            with self._open_frame(frame_path) as frame:
+                frame.thumbnail(CONTACT_SHEET_TILE_SIZE, Image.Resampling.LANCZOS)
+                x = (index % columns) * tile_width
+                y = (index // columns) * tile_height
+
+                # Center the tile (vertical frames do not fill the cell)
+                sheet.paste(
+                    frame.convert("RGB"),
+                    (x + (tile_width - frame.width) // 2, y + (tile_height - frame.height) // 2)
+                )
+
+            draw.text(
+                (x + 6, y + 4),
+                str(index),
+                font=font,
+                fill=(255, 255, 255),
+                stroke_width=2,
+                stroke_fill=(0, 0, 0)
+            )
+
+        buffer = io.BytesIO()
+        sheet.save(buffer, "JPEG", quality=JPEG_QUALITY)
+
+        return _b64encode_buffer(buffer.getbuffer()), "image/jpeg"
+
+    def _encode_frames(
+        self,
+        frame_paths: List[str],
+        contact_sheet: bool = False
+    ) -> List[Tuple[str, str]]:
+        """
+        Encode frames for upload (blocking, run in a worker thread).
+
+        Args:
+            frame_paths: Paths to frame images
+            contact_sheet: Tile all frames into a single image
+
+        Returns:
+            List of (base64 encoded image, media type) tuples
+        """
+        if contact_sheet:
+            return [self._build_contact_sheet(frame_paths)]
+
+        # Encode all frames concurrently so file reads overlap base64 work
+        with ThreadPoolExecutor(max_workers=min(16, len(frame_paths))) as executor:
+            return list(executor.map(self._encode_image, frame_paths))
+
+    def _build_frame_result(self, analysis: Dict, frame_paths: List[str]) -> Dict[str, any]:
+        """
+        Build the analyze_frames() result from a parsed Claude response.
+
+        Args:
+            analysis: Parsed JSON analysis (plus raw_response)
+            frame_paths: Paths of the analyzed frames
+
+        Returns:
+            Frame analysis result dictionary
+        """
+        best_index = analysis.get("best_frame_index", 0)
+
+        return {
+            "best_frame_index": best_index,
+            "best_frame_path": frame_paths[best_index],
+            "reasoning": analysis.get("reasoning", ""),
+            "scores": analysis.get("frames", []),
+            "raw_response": analysis.get("raw_response", "")
         }
-        return media_types.get(ext, "image/jpeg")
 
-    def analyze_frames(
+    async def analyze_frames(
         self,
         frame_paths: List[str],
         video_description: str,
-        criteria: Optional[Dict[str, str]] = None
+        criteria: Optional[Dict[str, str]] = None,
+        contact_sheet: bool = False
     ) -> Dict[str, any]:
         """
         Analyze multiple frames and select the best one for thumbnail.
@@ -76,6 +496,8 @@ class FrameAnalyzer:
             frame_paths: List of paths to frame images
             video_description: Description/prompt about the video content
             criteria: Optional custom criteria for frame selection
+            contact_sheet: Send all frames tiled in a single image instead of
+                one image per frame (far fewer vision tokens, coarser detail)
 
         Returns:
             Dictionary containing:
@@ -91,66 +513,51 @@ class FrameAnalyzer:
             raise ValueError("No frames provided for analysis")
 
         # Build prompt for frame analysis
-        default_criteria = {
-            "visual_appeal": "Clear, well-lit, and visually engaging",
-            "composition": "Good framing and subject positioning",
-            "text_overlay": "Space for text overlay without obscuring key elements",
-            "engagement": "Likely to attract clicks and viewer interest",
-            "clarity": "Sharp focus, not blurry or transitional",
-        }
-
-        criteria = criteria or default_criteria
-        criteria_text = "\n".join([f"- {k}: {v}" for k, v in criteria.items()])
-
-        prompt = f"""You are an expert at analyzing video frames to select the best thumbnail image for YouTube videos.
-
-Video Description: {video_description}
-
-I'm providing you with {len(frame_paths)} frames from a video. Please analyze each frame based on these criteria:
-{criteria_text}
-
-For each frame, provide:
-1. A score from 1-10
-2. Brief assessment of strengths and weaknesses
-3. Suitability for thumbnail with text overlay
+        criteria_text = _format_criteria(tuple((criteria or DEFAULT_CRITERIA).items()))
+
+        cache_key = None
+        if self.cache:
+            try:
+                cache_key = await asyncio.to_thread(
+                    ResponseCache.make_key,
+                    "analyze_frames", self.analyze_model, video_description,
+                    criteria_text, str(contact_sheet),
+                    file_paths=frame_paths
+                )
+            except FileNotFoundError as e:
+                raise FileNotFoundError(f"Frame not found: {e.filename}") from e
+            cached = self.cache.get(cache_key)
+            if cached:
+                return self._build_frame_result(cached, frame_paths)
+
+        if contact_sheet:
+            frames_intro = (
+                f"I'm providing you with a contact sheet of {len(frame_paths)} frames from a video, "
+                f"tiled left to right, top to bottom. Each tile is labelled with its frame index."
+            )
+        else:
+            frames_intro = f"I'm providing you with {len(frame_paths)} frames from a video."
 
-Finally, recommend which frame would make the best thumbnail and explain why.
+        prompt = _ANALYZE_PROMPT.substitute(
+            video_description=video_description,
+            frames_intro=frames_intro,
+            criteria_text=criteria_text
+        )
 
-Format your response as JSON with this structure:
-{{
-    "frames": [
-        {{
-            "index": 0,
-            "score": 8,
-            "strengths": ["clear subject", "good lighting"],
-            "weaknesses": ["slightly off-center"],
-            "thumbnail_suitability": "Good space for text overlay at top"
-        }},
-        ...
-    ],
-    "best_frame_index": 3,
-    "reasoning": "Frame 3 is the best choice because..."
-}}"""
+        encoded = await asyncio.to_thread(self._encode_frames, frame_paths, contact_sheet)
 
         # Prepare content with all frames
-        content = []
-
-        # Add each frame as an image
-        for i, frame_path in enumerate(frame_paths):
-            if not os.path.exists(frame_path):
-                raise FileNotFoundError(f"Frame not found: {frame_path}")
-
-            image_data = self._encode_image(frame_path)
-            media_type = self._get_image_media_type(frame_path)
-
-            content.append({
+        content = [
+            {
                 "type": "image",
                 "source": {
                     "type": "base64",
                     "media_type": media_type,
                     "data": image_data,
                 },
-            })
+            }
+            for image_data, media_type in encoded
+        ]
 
         # Add the text prompt
         content.append({
@@ -160,8 +567,8 @@ Format your response as JSON with this structure:
 
         try:
             # Call Claude Vision API
-            response = self.client.messages.create(
-                model="claude-3-opus-20240229",
+            response_text = await self._create_message(
+                model=self.analyze_model,
                 max_tokens=2048,
                 messages=[{
                     "role": "user",
@@ -169,17 +576,10 @@ Format your response as JSON with this structure:
                 }]
             )
 
-            # Parse response
-            response_text = response.content[0].text
-
-            # Try to extract JSON from response
-            import json
-            import re
-
             # Look for JSON in the response
-            json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-            if json_match:
-                analysis = json.loads(json_match.group())
+            parsed = _extract_json(response_text)
+            if parsed is not None:
+                analysis = parsed
             else:
                 # Fallback: parse the response manually
                 analysis = {
@@ -188,22 +588,21 @@ Format your response as JSON with this structure:
                     "frames": []
                 }
 
-            best_index = analysis.get("best_frame_index", 0)
+            analysis["raw_response"] = response_text
+            result = self._build_frame_result(analysis, frame_paths)
 
-            return {
-                "best_frame_index": best_index,
-                "best_frame_path": frame_paths[best_index],
-                "reasoning": analysis.get("reasoning", ""),
-                "scores": analysis.get("frames", []),
-                "raw_response": response_text
-            }
+            # Only cache well-formed responses
+            if cache_key and parsed is not None:
+                self.cache.set(cache_key, analysis)
+
+            return result
 
         except anthropic.APIError as e:
             raise RuntimeError(f"Claude API error: {e}")
         except Exception as e:
             raise RuntimeError(f"Failed to analyze frames: {e}")
 
-    def generate_thumbnail_text(
+    async def generate_thumbnail_text(
         self,
         video_description: str,
         style: str = "youtube",
@@ -226,45 +625,28 @@ Format your response as JSON with this structure:
         Raises:
             RuntimeError: If API call fails
         """
-        style_guidelines = {
-            "youtube": "Engaging, attention-grabbing, uses power words, creates curiosity",
-            "minimalist": "Clean, simple, direct, 2-3 words max",
-            "bold": "Strong, impactful, uses action verbs and emotion",
-            "tech": "Professional, technical, clear value proposition",
-            "clickbait": "Extremely attention-grabbing, uses numbers, urgency, curiosity gaps"
-        }
-
-        style_guide = style_guidelines.get(style, style_guidelines["youtube"])
-
-        prompt = f"""You are an expert at creating catchy, effective thumbnail text for YouTube videos.
-
-Video Description: {video_description}
+        style_guide = STYLE_GUIDELINES.get(style, STYLE_GUIDELINES["youtube"])
 
-Style: {style}
-Style Guidelines: {style_guide}
-Maximum Words: {max_words}
-
-Create compelling thumbnail text that will:
-1. Grab attention immediately
-2. Clearly communicate the video's value
-3. Encourage clicks without being misleading
-4. Work well visually when overlaid on an image
-
-Provide:
-- Main text (large, primary text - max {max_words} words)
-- Optional subtext (smaller supporting text - 1-3 words)
-- Brief reasoning for your choices
+        cache_key = None
+        if self.cache:
+            cache_key = ResponseCache.make_key(
+                "generate_thumbnail_text", self.text_model, video_description,
+                style, str(max_words)
+            )
+            cached = self.cache.get(cache_key)
+            if cached:
+                return dict(cached)
 
-Format as JSON:
-{{
-    "main_text": "YOUR MAIN TEXT HERE",
-    "subtext": "optional subtext",
-    "reasoning": "why this text is effective..."
-}}"""
+        prompt = _TEXT_PROMPT.substitute(
+            video_description=video_description,
+            style=style,
+            style_guide=style_guide,
+            max_words=max_words
+        )
 
         try:
-            response = self.client.messages.create(
-                model="claude-3-opus-20240229",
+            response_text = await self._create_message(
+                model=self.text_model,
                 max_tokens=1024,
                 messages=[{
                     "role": "user",
@@ -272,15 +654,10 @@ Format as JSON:
                 }]
             )
 
-            response_text = response.content[0].text
-
             # Parse JSON response
-            import json
-            import re
-
-            json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-            if json_match:
-                result = json.loads(json_match.group())
+            parsed = _extract_json(response_text)
+            if parsed is not None:
+                result = parsed
             else:
                 # Fallback
                 result = {
@@ -289,6 +666,9 @@ Format as JSON:
                     "reasoning": "Fallback text generation"
                 }
 
+            if cache_key and parsed is not None:
+                self.cache.set(cache_key, result)
+
             return result
 
         except anthropic.APIError as e:
@@ -296,12 +676,13 @@ Format as JSON:
         except Exception as e:
             raise RuntimeError(f"Failed to generate text: {e}")
 
-    def analyze_and_generate(
+    async def analyze_and_generate(
         self,
         frame_paths: List[str],
         video_description: str,
         style: str = "youtube",
-        max_words: int = 6
+        max_words: int = 6,
+        contact_sheet: bool = False
     ) -> Tuple[Dict, Dict]:
         """
         Combined analysis: select best frame and generate text.
@@ -311,11 +692,15 @@ Format as JSON:
             video_description: Video description/prompt
             style: Text style
             max_words: Max words for text
+            contact_sheet: Send frames as a single contact sheet image
 
         Returns:
             Tuple of (frame_analysis, text_generation) dictionaries
         """
-        frame_analysis = self.analyze_frames(frame_paths, video_description)
-        text_result = self.generate_thumbnail_text(video_description, style, max_words)
+        # Both requests are independent, so run them concurrently
+        frame_analysis, text_result = await asyncio.gather(
+            self.analyze_frames(frame_paths, video_description, contact_sheet=contact_sheet),
+            self.generate_thumbnail_text(video_description, style, max_words)
+        )
 
         return frame_analysis, text_result
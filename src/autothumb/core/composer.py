@@ -1,9 +1,170 @@
 """Module for composing thumbnail images with text overlays."""
 
 import os
+import math
+import functools
 from typing import Tuple, Optional, Dict, List
 from pathlib import Path
-from PIL import Image, ImageDraw, ImageFont, ImageFilter, ImageEnhance
+from PIL import Image, ImageDraw, ImageFont, ImageEnhance
+
+
+# Half-height, in pixels, of the soft edge above and below the text overlay
+OVERLAY_FEATHER = 10
+
+
+# Common font locations, tried in order
+_REGULAR_FONT_PATHS = [
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
+    "/System/Library/Fonts/Helvetica.ttc",
+    "arial.ttf",
+]
+_BOLD_FONT_PATHS = [
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+    "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf",
+    "/System/Library/Fonts/Helvetica.ttc",
+    "arial.ttf",
+]
+
+
+def _resolve_font_path(candidates: List[str]) -> Optional[str]:
+    """
+    Find the first existing font file.
+
+    Args:
+        candidates: Font paths to try, in order
+
+    Returns:
+        Path to the font, or None if none exists
+    """
+    return next((path for path in candidates if os.path.exists(path)), None)
+
+
+# Installed fonts don't change while running: probe the filesystem once
+_FONT_REGULAR = _resolve_font_path(_REGULAR_FONT_PATHS)
+_FONT_BOLD = _resolve_font_path(_BOLD_FONT_PATHS)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_font(font_path: Optional[str], size: int) -> ImageFont.FreeTypeFont:
+    """
+    Load a font, caching the parsed FreeType face per (path, size).
+
+    Only a handful of sizes are used across all styles, so a batch of
+    thumbnails reuses the same few font objects. Keying on the path lets
+    regular and bold share a face when both resolve to the same file.
+
+    Args:
+        font_path: Path to the font file (None for Pillow's default font)
+        size: Font size
+
+    Returns:
+        Font object
+    """
+    if font_path:
+        try:
+            return ImageFont.truetype(font_path, size)
+        except OSError:
+            pass
+
+    # Fallback to default font
+    return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=256)
+def _wrap_lines(
+    text: str,
+    font: ImageFont.FreeTypeFont,
+    max_width: int
+) -> Tuple[str, ...]:
+    """
+    Wrap text to fit within max width, caching the result.
+
+    Fonts come from the _load_font cache, so the same text rendered again
+    (e.g. a series in batch mode) hits the cache across composer instances.
+
+    Args:
+        text: Text to wrap
+        font: Font object
+        max_width: Maximum width in pixels
+
+    Returns:
+        Tuple of text lines
+    """
+    words = text.split()
+    lines = []
+    current_line = []
+    current_width = 0.0
+
+    # Measure each word once and keep a running line width, instead of
+    # re-laying out the whole line for every added word
+    space_width = font.getlength(" ")
+
+    for word in words:
+        word_width = font.getlength(word)
+        width = current_width + space_width + word_width if current_line else word_width
+
+        if width <= max_width:
+            current_line.append(word)
+            current_width = width
+        else:
+            if current_line:
+                lines.append(" ".join(current_line))
+            current_line = [word]
+            current_width = word_width
+
+    if current_line:
+        lines.append(" ".join(current_line))
+
+    return tuple(lines)
+
+
+@functools.lru_cache(maxsize=64)
+def _render_text_masks(
+    text: str,
+    font: ImageFont.FreeTypeFont,
+    outline_width: int
+) -> Tuple[Image.Image, Optional[Image.Image], Tuple[int, int]]:
+    """
+    Rasterize a line of text into reusable alpha masks.
+
+    The glyph mask serves both the shadow and the text fill, so each line
+    is rasterized once for the glyphs and once for the outline. Results are
+    cached: when a batch repeats the same title or subtitle, drawing it
+    again is only a few pastes. The masks are shared and must not be
+    modified.
+
+    Args:
+        text: Text to render
+        font: Font object
+        outline_width: Width of outline (0 for no outline)
+
+    Returns:
+        Tuple of (glyph mask, outline mask or None, offset of the masks
+        relative to the "ma" (middle, ascender) anchor point)
+    """
+    left, top, right, bottom = font.getbbox(text, stroke_width=outline_width, anchor="ma")
+    size = (right - left, bottom - top)
+    origin = (-left, -top)
+
+    glyph_mask = Image.new("L", size, 0)
+    ImageDraw.Draw(glyph_mask).text(origin, text, font=font, fill=255, anchor="ma")
+
+    outline_mask = None
+    if outline_width > 0:
+        # Same fill and stroke ink: Pillow rasterizes the filled stroke once
+        outline_mask = Image.new("L", size, 0)
+        ImageDraw.Draw(outline_mask).text(
+            origin,
+            text,
+            font=font,
+            fill=255,
+            stroke_width=outline_width,
+            stroke_fill=255,
+            anchor="ma"
+        )
+
+    return glyph_mask, outline_mask, (left, top)
 
 
 class ThumbnailComposer:
@@ -78,83 +239,46 @@ class ThumbnailComposer:
         Returns:
             Font object
         """
-        font_paths = [
-            # Try common font locations
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf" if bold else "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-            "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf" if bold else "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
-            "/System/Library/Fonts/Helvetica.ttc",
-            "arial.ttf",
-        ]
-
-        for font_path in font_paths:
-            if os.path.exists(font_path):
-                try:
-                    return ImageFont.truetype(font_path, size)
-                except Exception:
-                    continue
-
-        # Fallback to default font
-        return ImageFont.load_default()
-
-    def _add_shadow(
-        self,
-        draw: ImageDraw.ImageDraw,
-        text: str,
-        position: Tuple[int, int],
-        font: ImageFont.FreeTypeFont,
-        offset: int = 4
-    ):
-        """
-        Add shadow to text.
-
-        Args:
-            draw: ImageDraw object
-            text: Text to draw
-            position: Text position (x, y)
-            font: Font object
-            offset: Shadow offset in pixels
-        """
-        shadow_pos = (position[0] + offset, position[1] + offset)
-        draw.text(shadow_pos, text, font=font, fill=(0, 0, 0, 180))
+        return _load_font(_FONT_BOLD if bold else _FONT_REGULAR, size)
 
-    def _draw_text_with_outline(
+    def _draw_text(
         self,
-        draw: ImageDraw.ImageDraw,
+        image: Image.Image,
         text: str,
         position: Tuple[int, int],
         font: ImageFont.FreeTypeFont,
         text_color: Tuple[int, int, int],
         outline_color: Optional[Tuple[int, int, int]],
-        outline_width: int
+        outline_width: int,
+        shadow_offset: int = 0
     ):
         """
-        Draw text with outline.
+        Draw a line of text with optional shadow and outline.
 
         Args:
-            draw: ImageDraw object
+            image: Image to draw on (modified in place)
             text: Text to draw
-            position: Text position (x, y)
+            position: Anchor point (horizontal middle, ascender) of the line
             font: Font object
             text_color: RGB color for text
             outline_color: RGB color for outline (None for no outline)
             outline_width: Width of outline
+            shadow_offset: Shadow offset in pixels (0 for no shadow)
         """
-        x, y = position
-
-        # Draw outline if specified
-        if outline_color and outline_width > 0:
-            for adj_x in range(-outline_width, outline_width + 1):
-                for adj_y in range(-outline_width, outline_width + 1):
-                    if adj_x != 0 or adj_y != 0:
-                        draw.text(
-                            (x + adj_x, y + adj_y),
-                            text,
-                            font=font,
-                            fill=outline_color
-                        )
-
-        # Draw main text
-        draw.text(position, text, font=font, fill=text_color)
+        if not outline_color:
+            outline_width = 0
+
+        glyph_mask, outline_mask, (left, top) = _render_text_masks(text, font, outline_width)
+        x = position[0] + left
+        y = position[1] + top
+
+        if shadow_offset:
+            image.paste((0, 0, 0), (x + shadow_offset, y + shadow_offset), glyph_mask)
+
+        if outline_mask is not None:
+            image.paste(outline_color, (x, y), outline_mask)
+
+        image.paste(text_color, (x, y), glyph_mask)
 
     def _wrap_text(
         self,
@@ -173,26 +297,7 @@ class ThumbnailComposer:
         Returns:
             List of text lines
         """
-        words = text.split()
-        lines = []
-        current_line = []
-
-        for word in words:
-            test_line = " ".join(current_line + [word])
-            bbox = font.getbbox(test_line)
-            width = bbox[2] - bbox[0]
-
-            if width <= max_width:
-                current_line.append(word)
-            else:
-                if current_line:
-                    lines.append(" ".join(current_line))
-                current_line = [word]
-
-        if current_line:
-            lines.append(" ".join(current_line))
-
-        return lines
+        return list(_wrap_lines(text, font, max_width))
 
     def _add_background_overlay(
         self,
@@ -211,15 +316,11 @@ class ThumbnailComposer:
             height_ratio: Height of overlay as ratio of image height
 
         Returns:
-            Image with overlay
+            Image with overlay (the same image, modified in place)
         """
         width, height = image.size
         overlay_height = int(height * height_ratio)
 
-        # Create overlay
-        overlay = Image.new("RGBA", image.size, (0, 0, 0, 0))
-        overlay_draw = ImageDraw.Draw(overlay)
-
         # Calculate position
         if position == "top":
             y_start = 0
@@ -231,18 +332,29 @@ class ThumbnailComposer:
             y_start = (height - overlay_height) // 2
             y_end = y_start + overlay_height
 
-        # Draw gradient overlay
+        # Only the band and its soft edges are touched; the rest of the
+        # image would be a no-op blend
+        band_top = max(0, y_start - OVERLAY_FEATHER) if y_start > 0 else 0
+        band_bottom = min(height, y_end + OVERLAY_FEATHER) if y_end < height else height
+
+        # Build the alpha of one column, with a linear ramp for soft edges
+        # wherever the band does not touch the image border, then stretch it
+        # across the width (no full-image blur needed)
         alpha = int(255 * opacity)
-        overlay_draw.rectangle(
-            [(0, y_start), (width, y_end)],
-            fill=(0, 0, 0, alpha)
-        )
+        ramp = 2 * OVERLAY_FEATHER
+        column = []
+        for y in range(band_top, band_bottom):
+            fade_in = (y - y_start + OVERLAY_FEATHER) / ramp if y_start > 0 else 1
+            fade_out = (y_end + OVERLAY_FEATHER - y) / ramp if y_end < height else 1
+            column.append(int(alpha * max(0.0, min(1.0, fade_in, fade_out))))
 
-        # Apply Gaussian blur for smoother edges
-        overlay = overlay.filter(ImageFilter.GaussianBlur(radius=10))
+        mask = Image.new("L", (1, band_bottom - band_top))
+        mask.putdata(column)
+        mask = mask.resize((width, band_bottom - band_top), Image.Resampling.NEAREST)
 
-        # Composite overlay with image
-        return Image.alpha_composite(image.convert("RGBA"), overlay)
+        # Paste black through the mask, blending in place
+        image.paste((0, 0, 0), (0, band_top, width, band_bottom), mask)
+        return image
 
     def compose(
         self,
@@ -251,7 +363,9 @@ class ThumbnailComposer:
         output_path: str,
         subtext: Optional[str] = None,
         resolution: Tuple[int, int] = (1280, 720),
-        custom_style: Optional[Dict] = None
+        custom_style: Optional[Dict] = None,
+        sharpen: float = 1.0,
+        fast: bool = True
     ) -> str:
         """
         Compose thumbnail with text overlay.
@@ -263,6 +377,11 @@ class ThumbnailComposer:
             subtext: Optional secondary text
             resolution: Target resolution (width, height)
             custom_style: Optional custom style overrides
+            sharpen: Sharpness factor applied before saving (1.0 skips the
+                extra full-image filter pass)
+            fast: Single-pass JPEG encode (quality 92, 4:2:0 chroma). False
+                uses quality 95 with optimized Huffman tables: ~1% smaller
+                files for a second encoder pass
 
         Returns:
             Path to generated thumbnail
@@ -277,119 +396,298 @@ class ThumbnailComposer:
         try:
             # Load and resize image
             image = Image.open(image_path)
-            image = image.convert("RGB")
-            image = image.resize(resolution, Image.Resampling.LANCZOS)
+            # JPEGs much larger than the target (e.g. 4K frames) are decoded
+            # directly at 1/2, 1/4 or 1/8 scale, never below the target size
+            image.draft("RGB", resolution)
+            image = self._fit_image(image, resolution)
 
-            # Apply style overrides
-            style = self.style.copy()
-            if custom_style:
-                style.update(custom_style)
+            image = self._render(image, main_text, subtext, resolution, custom_style, sharpen)
+            return self._save(image, output_path, fast)
 
-            # Convert to RGBA for compositing
-            image = image.convert("RGBA")
+        except Exception as e:
+            raise RuntimeError(f"Failed to compose thumbnail: {e}")
 
-            # Add background overlay if specified
-            if style.get("background_opacity", 0) > 0:
-                image = self._add_background_overlay(
-                    image,
-                    style["position"],
-                    style["background_opacity"]
+    def compose_image(
+        self,
+        image: Image.Image,
+        main_text: str,
+        output_path: str,
+        subtext: Optional[str] = None,
+        resolution: Tuple[int, int] = (1280, 720),
+        custom_style: Optional[Dict] = None,
+        sharpen: float = 1.0,
+        fast: bool = True
+    ) -> str:
+        """
+        Compose thumbnail with text overlay from an in-memory image.
+
+        Same as compose(), for a frame that is already decoded (e.g. from
+        VideoProcessor.read_frame()): it is never encoded to JPEG and read
+        back. The given image is left unchanged.
+
+        Args:
+            image: Base image (any mode, any size)
+            main_text: Main text to overlay
+            output_path: Path to save final thumbnail
+            subtext: Optional secondary text
+            resolution: Target resolution (width, height)
+            custom_style: Optional custom style overrides
+            sharpen: Sharpness factor applied before saving
+            fast: Single-pass JPEG encode (see compose())
+
+        Returns:
+            Path to generated thumbnail
+
+        Raises:
+            RuntimeError: If composition fails
+        """
+        try:
+            fitted = self._fit_image(image, resolution)
+            if fitted is image:
+                # Text is drawn in place: work on a copy of the caller's image
+                fitted = image.copy()
+
+            image = self._render(fitted, main_text, subtext, resolution, custom_style, sharpen)
+            return self._save(image, output_path, fast)
+
+        except Exception as e:
+            raise RuntimeError(f"Failed to compose thumbnail: {e}")
+
+    def compose_multi_resolution(
+        self,
+        image_path: str,
+        main_text: str,
+        output_paths: Dict[Tuple[int, int], str],
+        subtext: Optional[str] = None,
+        custom_style: Optional[Dict] = None,
+        sharpen: float = 1.0,
+        fast: bool = True
+    ) -> Dict[Tuple[int, int], str]:
+        """
+        Compose the same thumbnail at several resolutions.
+
+        Sizes are grouped by aspect ratio (exact, e.g. 1280x720 and
+        1920x1080 share 16:9). Each group is rendered once at its largest
+        size and the other sizes are downscaled from that master, so text
+        rasterization and the overlay run once per ratio; a size with a
+        ratio of its own (e.g. a vertical 720x1280) is laid out like
+        compose() would. Within a group, every size is a scaled copy of the
+        master: font sizes, in pixels, apply to it.
+
+        Args:
+            image_path: Path to base image
+            main_text: Main text to overlay
+            output_paths: Output path for each resolution (width, height)
+            subtext: Optional secondary text
+            custom_style: Optional custom style overrides
+            sharpen: Sharpness factor applied to each master before scaling
+            fast: Single-pass JPEG encode (see compose())
+
+        Returns:
+            Path to each generated thumbnail, by resolution
+
+        Raises:
+            FileNotFoundError: If image file doesn't exist
+            ValueError: If no output path is given
+            RuntimeError: If composition fails
+        """
+        if not os.path.exists(image_path):
+            raise FileNotFoundError(f"Image not found: {image_path}")
+        if not output_paths:
+            raise ValueError("At least one output path is required")
+
+        # Scaling across ratios would stretch the layout: one master per ratio
+        groups: Dict[Tuple[int, int], List[Tuple[int, int]]] = {}
+        for width, height in output_paths:
+            divisor = math.gcd(width, height)
+            groups.setdefault((width // divisor, height // divisor), []).append((width, height))
+
+        try:
+            source = Image.open(image_path)
+            # Decode once, large enough for every master
+            source.draft("RGB", (
+                max(width for width, _ in output_paths),
+                max(height for _, height in output_paths)
+            ))
+            source.load()
+
+            results = {}
+            for resolutions in groups.values():
+                master_resolution = max(resolutions, key=lambda size: size[0] * size[1])
+                image = self._fit_image(source, master_resolution)
+                if image is source:
+                    # Text is drawn in place: keep the source clean for other ratios
+                    image = source.copy()
+                master = self._render(
+                    image, main_text, subtext, master_resolution, custom_style, sharpen
                 )
 
-            # Create drawing context
-            draw = ImageDraw.Draw(image)
+                for resolution in resolutions:
+                    # Same image at another size: resampled from the master only
+                    results[resolution] = self._save(
+                        self._fit_image(master, resolution),
+                        output_paths[resolution],
+                        fast
+                    )
+
+            return results
+
+        except Exception as e:
+            raise RuntimeError(f"Failed to compose thumbnail: {e}")
+
+    def _fit_image(self, image: Image.Image, resolution: Tuple[int, int]) -> Image.Image:
+        """
+        Convert an image to RGB at the target resolution.
+
+        Args:
+            image: Source image
+            resolution: Target resolution (width, height)
+
+        Returns:
+            RGB image of the target size (the source itself if it already is)
+        """
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+
+        # Frames from VideoProcessor usually already have the target size
+        if image.size != resolution:
+            downscale = image.width > resolution[0] or image.height > resolution[1]
+            if downscale:
+                # Box-reduce by an integer factor first, then LANCZOS
+                # over at most 3x the target size
+                image = image.resize(resolution, Image.Resampling.LANCZOS, reducing_gap=3.0)
+            else:
+                image = image.resize(resolution, Image.Resampling.BICUBIC)
+
+        return image
+
+    def _render(
+        self,
+        image: Image.Image,
+        main_text: str,
+        subtext: Optional[str],
+        resolution: Tuple[int, int],
+        custom_style: Optional[Dict],
+        sharpen: float
+    ) -> Image.Image:
+        """
+        Draw the overlay and text on a fitted image.
 
-            # Get fonts
-            main_font = self._get_font(
-                style["font_size_main"],
-                style.get("bold", False)
+        Args:
+            image: RGB image of the target size (drawn on in place)
+            main_text: Main text to overlay
+            subtext: Optional secondary text
+            resolution: Target resolution (width, height)
+            custom_style: Optional custom style overrides
+            sharpen: Sharpness factor applied at the end
+
+        Returns:
+            Finished thumbnail image
+        """
+        # Apply style overrides
+        style = self.style.copy()
+        if custom_style:
+            style.update(custom_style)
+
+        # Add background overlay if specified
+        if style.get("background_opacity", 0) > 0:
+            image = self._add_background_overlay(
+                image,
+                style["position"],
+                style["background_opacity"]
             )
-            sub_font = self._get_font(
-                style["font_size_sub"],
-                False
+
+        # Get fonts
+        main_font = self._get_font(
+            style["font_size_main"],
+            style.get("bold", False)
+        )
+        sub_font = self._get_font(
+            style["font_size_sub"],
+            False
+        )
+
+        # Wrap text
+        max_width = int(resolution[0] * 0.9)  # 90% of image width
+        main_lines = self._wrap_text(main_text, main_font, max_width)
+
+        # Calculate text dimensions
+        line_height = style["font_size_main"] + 10
+        total_text_height = len(main_lines) * line_height
+
+        if subtext:
+            sub_lines = self._wrap_text(subtext, sub_font, max_width)
+            total_text_height += len(sub_lines) * (style["font_size_sub"] + 10) + 20
+
+        # Calculate starting Y position based on style
+        if style["position"] == "top":
+            y = 50
+        elif style["position"] == "bottom":
+            y = resolution[1] - total_text_height - 50
+        else:  # center
+            y = (resolution[1] - total_text_height) // 2
+
+        # Lines are centered horizontally by the "ma" (middle, ascender) anchor
+        x = resolution[0] // 2
+
+        # Draw main text with outline and optional shadow
+        for line in main_lines:
+            self._draw_text(
+                image,
+                line,
+                (x, y),
+                main_font,
+                style["text_color"],
+                style["outline_color"],
+                style["outline_width"],
+                shadow_offset=5 if style.get("shadow", False) else 0
             )
 
-            # Wrap text
-            max_width = int(resolution[0] * 0.9)  # 90% of image width
-            main_lines = self._wrap_text(main_text, main_font, max_width)
-
-            # Calculate text dimensions
-            line_height = style["font_size_main"] + 10
-            total_text_height = len(main_lines) * line_height
-
-            if subtext:
-                sub_lines = self._wrap_text(subtext, sub_font, max_width)
-                total_text_height += len(sub_lines) * (style["font_size_sub"] + 10) + 20
-
-            # Calculate starting Y position based on style
-            if style["position"] == "top":
-                y = 50
-            elif style["position"] == "bottom":
-                y = resolution[1] - total_text_height - 50
-            else:  # center
-                y = (resolution[1] - total_text_height) // 2
-
-            # Draw main text
-            for line in main_lines:
-                bbox = main_font.getbbox(line)
-                text_width = bbox[2] - bbox[0]
-                x = (resolution[0] - text_width) // 2
-
-                # Add shadow if enabled
-                if style.get("shadow", False):
-                    self._add_shadow(draw, line, (x, y), main_font, offset=5)
-
-                # Draw text with outline
-                self._draw_text_with_outline(
-                    draw,
+            y += line_height
+
+        # Draw subtext if provided
+        if subtext:
+            y += 20  # Add spacing
+            for line in sub_lines:
+                self._draw_text(
+                    image,
                     line,
                     (x, y),
-                    main_font,
+                    sub_font,
                     style["text_color"],
                     style["outline_color"],
-                    style["outline_width"]
+                    max(style["outline_width"] - 1, 1),
+                    shadow_offset=3 if style.get("shadow", False) else 0
                 )
 
-                y += line_height
-
-            # Draw subtext if provided
-            if subtext:
-                y += 20  # Add spacing
-                for line in self._wrap_text(subtext, sub_font, max_width):
-                    bbox = sub_font.getbbox(line)
-                    text_width = bbox[2] - bbox[0]
-                    x = (resolution[0] - text_width) // 2
-
-                    if style.get("shadow", False):
-                        self._add_shadow(draw, line, (x, y), sub_font, offset=3)
-
-                    self._draw_text_with_outline(
-                        draw,
-                        line,
-                        (x, y),
-                        sub_font,
-                        style["text_color"],
-                        style["outline_color"],
-                        max(style["outline_width"] - 1, 1)
-                    )
+                y += style["font_size_sub"] + 10
 
-                    y += style["font_size_sub"] + 10
+        # Optional sharpening; barely visible after JPEG quantization
+        if sharpen != 1.0:
+            image = ImageEnhance.Sharpness(image).enhance(sharpen)
 
-            # Convert back to RGB for saving
-            image = image.convert("RGB")
+        return image
 
-            # Enhance image slightly
-            enhancer = ImageEnhance.Sharpness(image)
-            image = enhancer.enhance(1.2)
+    def _save(self, image: Image.Image, output_path: str, fast: bool) -> str:
+        """
+        Save a finished thumbnail as JPEG.
 
-            # Save with high quality
-            os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
-            image.save(output_path, "JPEG", quality=95, optimize=True)
+        Args:
+            image: Finished thumbnail image
+            output_path: Path to save final thumbnail
+            fast: Single-pass JPEG encode
 
-            return output_path
+        Returns:
+            Path to generated thumbnail
+        """
+        # Save with high quality
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        if fast:
+            image.save(output_path, "JPEG", quality=92, subsampling="4:2:0")
+        else:
+            image.save(output_path, "JPEG", quality=95, optimize=True)
 
-        except Exception as e:
-            raise RuntimeError(f"Failed to compose thumbnail: {e}")
+        return output_path
 
     def create_thumbnail_from_analysis(
         self,
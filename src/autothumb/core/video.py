@@ -1,22 +1,75 @@
 """Module for video processing and frame extraction using FFmpeg."""
 
+import io
 import os
+import functools
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional
-import json
+from typing import TYPE_CHECKING, List, Dict, Optional
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+# PyAV and Pillow are imported on first use (see _load_av), so probing
+# metadata (`autothumb info`) only costs an ffprobe call
+
+
+# Frames are scaled to this width (keeping aspect ratio) unless disabled
+DEFAULT_FRAME_WIDTH = 1280
+
+# No banner, only errors on stderr, never read stdin
+FFMPEG_CMD = ["ffmpeg", "-hide_banner", "-loglevel", "error", "-nostdin"]
+
+# Frame JPEG settings: high quality (the frame becomes the thumbnail) but
+# single-pass encoding, since frames are temporary and size barely matters
+FRAME_JPEG_QUALITY = 95
+FFMPEG_JPEG_ARGS = ["-q:v", "2", "-huffman", "default"]
+
+# With PyAV, targets closer than this are reached by decoding forward
+# (about one keyframe interval) instead of seeking back to a keyframe
+FORWARD_DECODE_SECONDS = 5.0
+
+# PyAV hardware decoders to try, in order of preference (FFmpeg itself
+# picks one with `-hwaccel auto`)
+HW_DEVICE_TYPES = ("cuda", "videotoolbox", "vaapi", "d3d11va", "qsv")
+
+
+@functools.lru_cache(maxsize=None)
+def _load_av():
+    """
+    Import PyAV, used for in-process decoding when installed.
+
+    Returns:
+        The av module, or None if it is not installed
+    """
+    try:
+        import av
+    except ImportError:
+        return None
+
+    return av
 
 
 class VideoProcessor:
     """Handle video processing and frame extraction."""
 
-    def __init__(self, video_path: str):
+    def __init__(
+        self,
+        video_path: str,
+        hw_accel: bool = True,
+        metadata: Optional[Dict] = None
+    ):
         """
         Initialize the video processor.
 
         Args:
             video_path: Path to the video file
+            hw_accel: Decode on the GPU when one is available (NVDEC,
+                VideoToolbox, VAAPI...), falling back to the CPU otherwise
+            metadata: Metadata from an earlier probe of the same file (as
+                in `processor.metadata`); skips FFprobe when given
 
         Raises:
             FileNotFoundError: If video file doesn't exist
@@ -26,8 +79,12 @@ class VideoProcessor:
         if not self.video_path.exists():
             raise FileNotFoundError(f"Video file not found: {video_path}")
 
-        self.metadata = self._get_metadata()
+        self.hw_accel = hw_accel
+        self.metadata = dict(metadata) if metadata is not None else self._get_metadata()
         self.temp_dir = None
+        self._container = None
+        self._frames = None
+        self._position = None
 
     def _get_metadata(self) -> Dict:
         """
@@ -40,12 +97,14 @@ class VideoProcessor:
             RuntimeError: If FFprobe fails to extract metadata
         """
         try:
+            # Ask only for the fields we use, as flat key=value lines
             cmd = [
                 "ffprobe",
                 "-v", "quiet",
-                "-print_format", "json",
-                "-show_format",
-                "-show_streams",
+                "-select_streams", "v:0",
+                "-show_entries",
+                "stream=codec_name,width,height,r_frame_rate:format=duration,bit_rate",
+                "-of", "default=noprint_wrappers=1",
                 str(self.video_path)
             ]
 
@@ -56,34 +115,32 @@ class VideoProcessor:
                 check=True
             )
 
-            data = json.loads(result.stdout)
-
-            # Find video stream
-            video_stream = next(
-                (s for s in data["streams"] if s["codec_type"] == "video"),
-                None
-            )
+            fields = {}
+            for line in result.stdout.splitlines():
+                key, sep, value = line.partition("=")
+                if sep and value != "N/A":
+                    fields[key] = value
 
-            if not video_stream:
+            if "width" not in fields:
                 raise ValueError("No video stream found in file")
 
             # Extract FPS
-            fps_str = video_stream.get("r_frame_rate", "30/1")
+            fps_str = fields.get("r_frame_rate", "30/1")
             fps_parts = fps_str.split("/")
             fps = float(fps_parts[0]) / float(fps_parts[1])
 
             return {
-                "duration": float(data["format"].get("duration", 0)),
-                "width": int(video_stream.get("width", 0)),
-                "height": int(video_stream.get("height", 0)),
+                "duration": float(fields.get("duration", 0)),
+                "width": int(fields["width"]),
+                "height": int(fields.get("height", 0)),
                 "fps": fps,
-                "codec": video_stream.get("codec_name", "unknown"),
-                "bitrate": int(data["format"].get("bit_rate", 0)),
+                "codec": fields.get("codec_name", "unknown"),
+                "bitrate": int(fields.get("bit_rate", 0)),
             }
 
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"FFprobe failed: {e.stderr}")
-        except (json.JSONDecodeError, KeyError, ValueError) as e:
+        except (KeyError, ValueError, ZeroDivisionError) as e:
             raise RuntimeError(f"Failed to parse video metadata: {e}")
 
     def extract_frames(
@@ -91,7 +148,8 @@ class VideoProcessor:
         num_frames: int = 10,
         output_dir: Optional[str] = None,
         skip_start_seconds: float = 2.0,
-        skip_end_seconds: float = 2.0
+        skip_end_seconds: float = 2.0,
+        scale_width: Optional[int] = DEFAULT_FRAME_WIDTH
     ) -> List[str]:
         """
         Extract evenly spaced frames from the video.
@@ -101,6 +159,8 @@ class VideoProcessor:
             output_dir: Directory to save frames (uses temp dir if None)
             skip_start_seconds: Skip this many seconds from the start
             skip_end_seconds: Skip this many seconds from the end
+            scale_width: Width to scale frames to (None keeps the source size
+                and skips the scaler)
 
         Returns:
             List of paths to extracted frame images
@@ -108,6 +168,50 @@ class VideoProcessor:
         Raises:
             RuntimeError: If FFmpeg fails to extract frames
         """
+        # Calculate timestamps for frame extraction
+        duration = self.metadata["duration"]
+        usable_duration = duration - skip_start_seconds - skip_end_seconds
+
+        if usable_duration <= 0:
+            raise ValueError("Video too short after skipping start/end")
+
+        # Calculate timestamps for frame extraction
+        if num_frames <= 1:
+            timestamps = [skip_start_seconds + usable_duration / 2]
+        else:
+            step = usable_duration / (num_frames - 1)
+            timestamps = [skip_start_seconds + i * step for i in range(num_frames)]
+
+        return self.extract_frames_batch(timestamps, output_dir, scale_width)
+
+    def extract_frames_batch(
+        self,
+        timestamps: List[float],
+        output_dir: Optional[str] = None,
+        scale_width: Optional[int] = DEFAULT_FRAME_WIDTH
+    ) -> List[str]:
+        """
+        Extract the frames at several timestamps in one pass.
+
+        The video is opened once for all timestamps. They are visited in
+        increasing order, so nearby frames are reached by decoding forward
+        instead of seeking again.
+
+        Args:
+            timestamps: Times in seconds (any order, duplicates ignored)
+            output_dir: Directory to save frames (uses temp dir if None)
+            scale_width: Width to scale frames to (None keeps the source size)
+
+        Returns:
+            List of paths to extracted frame images, numbered in time order
+
+        Raises:
+            ValueError: If no timestamp is given
+            RuntimeError: If FFmpeg fails to extract frames
+        """
+        if not timestamps:
+            raise ValueError("At least one timestamp is required")
+
         # Create output directory
         if output_dir is None:
             self.temp_dir = tempfile.mkdtemp(prefix="autothumb_")
@@ -115,56 +219,341 @@ class VideoProcessor:
         else:
             os.makedirs(output_dir, exist_ok=True)
 
-        output_pattern = os.path.join(output_dir, "frame_%04d.jpg")
+        # Short videos with many frames can round to the same millisecond
+        timestamps = sorted(set(round(t, 3) for t in timestamps))
 
-        # Calculate timestamps for frame extraction
-        duration = self.metadata["duration"]
-        usable_duration = duration - skip_start_seconds - skip_end_seconds
+        if _load_av() is not None:
+            frame_files = self._extract_with_av(timestamps, output_dir, scale_width)
 
-        if usable_duration <= 0:
-            raise ValueError("Video too short after skipping start/end")
+            if not frame_files:
+                raise RuntimeError("No frames were extracted")
 
-        # Calculate timestamps for frame extraction
-        timestamps = [
-            skip_start_seconds + (i * usable_duration / (num_frames - 1))
-            for i in range(num_frames)
+            return frame_files
+
+        # Split the timestamps across one FFmpeg process per core
+        workers = min(os.cpu_count() or 1, len(timestamps))
+        group_size = -(-len(timestamps) // workers)
+        groups = [
+            (timestamps[start:start + group_size], start + 1)
+            for start in range(0, len(timestamps), group_size)
         ]
 
-        # Extract each frame individually using seek
-        frame_files = []
-        try:
-            for idx, timestamp in enumerate(timestamps, start=1):
-                frame_path = os.path.join(output_dir, f"frame_{idx:04d}.jpg")
-
-                cmd = [
-                    "ffmpeg",
-                    "-ss", str(timestamp),
-                    "-i", str(self.video_path),
-                    "-vframes", "1",
-                    "-vf", "scale=1280:-1",
-                    "-q:v", "2",
-                    "-y",
-                    frame_path
-                ]
-
-                subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    check=True,
-                    text=True
+        with ThreadPoolExecutor(max_workers=len(groups)) as executor:
+            futures = [
+                executor.submit(
+                    self._extract_at_timestamps,
+                    group,
+                    output_dir,
+                    start_index,
+                    scale_width
                 )
+                for group, start_index in groups
+            ]
+            frame_files = sorted(p for future in futures for p in future.result())
 
-                if os.path.exists(frame_path):
-                    frame_files.append(frame_path)
+        if not frame_files:
+            raise RuntimeError("No frames were extracted")
 
-            if not frame_files:
-                raise RuntimeError("No frames were extracted")
+        return frame_files
+
+    def _extract_at_timestamps(
+        self,
+        timestamps: List[float],
+        output_dir: str,
+        start_index: int = 1,
+        scale_width: Optional[int] = DEFAULT_FRAME_WIDTH
+    ) -> List[str]:
+        """
+        Extract one frame per timestamp with a single FFmpeg process.
 
-            return sorted(frame_files)
+        Each timestamp opens its own input with a fast `-ss` seek and maps it
+        to its own output, so process startup and codec setup happen once
+        while every frame is still decoded from its nearest keyframe only.
 
+        Args:
+            timestamps: Times in seconds
+            output_dir: Directory to save frames
+            start_index: Number of the first frame file (frame_0001.jpg)
+            scale_width: Width to scale frames to (None keeps the source size)
+
+        Returns:
+            Sorted list of paths to extracted frame images
+
+        Raises:
+            RuntimeError: If FFmpeg fails to extract frames
+        """
+        # One decoder thread per input: the inputs already decode in parallel
+        cmd = list(FFMPEG_CMD)
+        for timestamp in timestamps:
+            cmd += [
+                *self._hwaccel_args(),
+                "-threads", "1",
+                "-ss", str(timestamp),
+                "-i", str(self.video_path)
+            ]
+
+        frame_paths = []
+        for input_idx, idx in enumerate(range(start_index, start_index + len(timestamps))):
+            frame_path = os.path.join(output_dir, f"frame_{idx:04d}.jpg")
+            cmd += ["-map", f"{input_idx}:v:0", "-an", "-sn", "-dn", "-frames:v", "1"]
+            if scale_width:
+                cmd += ["-vf", f"scale={scale_width}:-1"]
+            cmd += [*FFMPEG_JPEG_ARGS, "-y", frame_path]
+            frame_paths.append(frame_path)
+
+        try:
+            subprocess.run(
+                cmd,
+                capture_output=True,
+                check=True,
+                text=True
+            )
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"FFmpeg failed to extract frames: {e.stderr}")
 
+        return sorted(p for p in frame_paths if os.path.exists(p))
+
+    def _hwaccel_args(self) -> List[str]:
+        """
+        FFmpeg input options for hardware decoding.
+
+        Returns:
+            Options to put before `-i` (empty when hw_accel is off). FFmpeg
+            falls back to software decoding if no device can be used.
+        """
+        return ["-hwaccel", "auto"] if self.hw_accel else []
+
+    def _open_container(self):
+        """
+        Open the video with PyAV, once per processor.
+
+        With hw_accel, each hardware device type supported by the FFmpeg
+        build is tried in order of preference (support does not mean the
+        device is present); the first that opens is kept. Opening falls back
+        to software decoding if none can be created, and decoding does if the
+        device cannot handle the codec.
+
+        Software decoding uses frame and slice threads on all cores: PyAV
+        only enables slice threading by default, which does nothing for
+        the usual single-slice H.264/HEVC encodes.
+
+        Returns:
+            PyAV input container
+        """
+        if self._container is not None:
+            return self._container
+
+        av = _load_av()
+        try:
+            # Hardware decoding needs a recent PyAV
+            from av.codec.hwaccel import HWAccel, hwdevices_available
+        except ImportError:
+            HWAccel = None
+
+        container = None
+        if self.hw_accel and HWAccel is not None:
+            available = hwdevices_available()
+
+            for device_type in HW_DEVICE_TYPES:
+                if device_type not in available:
+                    continue
+                try:
+                    container = av.open(
+                        str(self.video_path),
+                        hwaccel=HWAccel(device_type, allow_software_fallback=True)
+                    )
+                    break
+                except av.FFmpegError:
+                    # No such device on this host: try the next type
+                    continue
+
+        if container is None:
+            container = av.open(str(self.video_path))
+
+        # Thread count 0 lets FFmpeg use one thread per core
+        stream = container.streams.video[0]
+        stream.thread_type = "AUTO"
+        stream.codec_context.thread_count = 0
+
+        self._container = container
+        return self._container
+
+    def _decode_frame_at(self, timestamp: float, approximate: bool = False):
+        """
+        Decode the first frame at or after a timestamp with PyAV.
+
+        Seeks to the preceding keyframe and decodes forward, like FFmpeg's
+        accurate input-side seek. When the target is shortly after the last
+        decoded frame, decoding simply continues from there: skipped frames
+        are decoded but never converted to RGB.
+
+        Args:
+            timestamp: Time in seconds from the start of the video
+            approximate: Return the keyframe at or before the timestamp
+                without decoding forward to it
+
+        Returns:
+            PyAV video frame, or None if the stream has no frames
+        """
+        container = self._open_container()
+        stream = container.streams.video[0]
+
+        start = float(stream.start_time * stream.time_base) if stream.start_time else 0.0
+        target = start + timestamp
+
+        nearby = (
+            self._frames is not None
+            and self._position is not None
+            and self._position < target <= self._position + FORWARD_DECODE_SECONDS
+        )
+        if approximate or not nearby:
+            container.seek(int(target / stream.time_base), stream=stream, backward=True)
+            self._frames = container.decode(stream)
+
+        frame = None
+        for frame in self._frames:
+            if frame.time is None:
+                continue
+            self._position = frame.time
+            if approximate or frame.time >= target:
+                return frame
+
+        # End of stream: fall back to the last frame, seek on next call
+        self._frames = None
+        return frame
+
+    @staticmethod
+    def _frame_to_image(frame, scale_width: Optional[int] = DEFAULT_FRAME_WIDTH) -> "Image.Image":
+        """
+        Convert a PyAV frame to a PIL image, scaled to a given width.
+
+        Scaling and conversion from the decoder's YUV to RGB happen in a
+        single swscale pass, without a full-size RGB intermediate.
+
+        Args:
+            frame: PyAV video frame
+            scale_width: Width to scale to (None keeps the source size)
+
+        Returns:
+            RGB image
+        """
+        if scale_width and frame.width != scale_width:
+            height = round(frame.height * scale_width / frame.width)
+            frame = frame.reformat(
+                width=scale_width,
+                height=height,
+                format="rgb24",
+                interpolation="BICUBIC"
+            )
+
+        return frame.to_image()
+
+    def _extract_with_av(
+        self,
+        timestamps: List[float],
+        output_dir: str,
+        scale_width: Optional[int] = DEFAULT_FRAME_WIDTH
+    ) -> List[str]:
+        """
+        Extract one frame per timestamp in-process with PyAV.
+
+        Frames are decoded in order on this thread while a small pool
+        converts, scales and writes the previous ones: Pillow releases the
+        GIL while resizing and encoding.
+
+        Args:
+            timestamps: Times in seconds
+            output_dir: Directory to save frames
+            scale_width: Width to scale frames to (None keeps the source size)
+
+        Returns:
+            Sorted list of paths to extracted frame images
+
+        Raises:
+            RuntimeError: If PyAV fails to decode the video
+        """
+        av = _load_av()
+
+        def save(frame, frame_path: str) -> str:
+            image = self._frame_to_image(frame, scale_width)
+            image.save(frame_path, "JPEG", quality=FRAME_JPEG_QUALITY, optimize=False)
+            return frame_path
+
+        with ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1)) as executor:
+            futures = []
+            try:
+                for idx, timestamp in enumerate(timestamps, start=1):
+                    frame = self._decode_frame_at(timestamp)
+                    if frame is None:
+                        continue
+
+                    frame_path = os.path.join(output_dir, f"frame_{idx:04d}.jpg")
+                    futures.append(executor.submit(save, frame, frame_path))
+
+            except av.FFmpegError as e:
+                raise RuntimeError(f"PyAV failed to extract frames: {e}")
+
+            return [future.result() for future in futures]
+
+    def read_frame(
+        self,
+        timestamp: float,
+        scale_width: Optional[int] = DEFAULT_FRAME_WIDTH
+    ) -> "Image.Image":
+        """
+        Decode the frame at a timestamp into memory, without writing a file.
+
+        Meant to be passed straight to ThumbnailComposer.compose_image(),
+        which avoids a JPEG encode and decode round trip through the disk.
+
+        Args:
+            timestamp: Time in seconds
+            scale_width: Width to scale the frame to (None keeps the source size)
+
+        Returns:
+            RGB image of the first frame at or after the timestamp
+
+        Raises:
+            RuntimeError: If decoding fails or there is no frame there
+        """
+        av = _load_av()
+        if av is not None:
+            try:
+                frame = self._decode_frame_at(timestamp)
+                if frame is not None:
+                    return self._frame_to_image(frame, scale_width)
+            except av.FFmpegError as e:
+                raise RuntimeError(f"PyAV failed to read frame: {e}")
+
+            raise RuntimeError(f"No frame found at {timestamp}s")
+
+        # Uncompressed PPM over a pipe: no lossy encode, no temp file
+        cmd = [
+            *FFMPEG_CMD,
+            *self._hwaccel_args(),
+            "-ss", str(timestamp),
+            "-i", str(self.video_path),
+            "-an", "-sn", "-dn",
+            "-frames:v", "1",
+        ]
+        if scale_width:
+            cmd += ["-vf", f"scale={scale_width}:-1"]
+        cmd += ["-f", "image2pipe", "-c:v", "ppm", "-"]
+
+        try:
+            result = subprocess.run(cmd, capture_output=True, check=True)
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"FFmpeg failed to read frame: {e.stderr.decode(errors='replace')}")
+
+        if not result.stdout:
+            raise RuntimeError(f"No frame found at {timestamp}s")
+
+        from PIL import Image
+
+        image = Image.open(io.BytesIO(result.stdout))
+        image.load()
+        return image
+
     def extract_frames_interval(
         self,
         interval_seconds: float = 5.0,
@@ -180,8 +569,15 @@ class VideoProcessor:
             max_frames: Maximum number of frames to extract
 
         Returns:
-            List of paths to extracted frame images
+            List of paths to extracted frame images (at least one: an
+            interval longer than the video gives its middle frame)
         """
+        duration = self.metadata["duration"]
+        if interval_seconds / 2 >= duration:
+            # No interval middle falls inside the video: the only, truncated
+            # interval is the whole video. Same result with either backend.
+            return self.extract_frames_batch([duration / 2], output_dir)
+
         # Create output directory
         if output_dir is None:
             self.temp_dir = tempfile.mkdtemp(prefix="autothumb_")
@@ -189,15 +585,27 @@ class VideoProcessor:
         else:
             os.makedirs(output_dir, exist_ok=True)
 
+        if _load_av() is not None:
+            # Sample the middle of each interval, like FFmpeg's fps filter;
+            # only the sampled frames are converted and encoded
+            timestamps = [
+                (i + 0.5) * interval_seconds
+                for i in range(max_frames)
+                if (i + 0.5) * interval_seconds < duration
+            ]
+            return self.extract_frames_batch(timestamps, output_dir)
+
         output_pattern = os.path.join(output_dir, "frame_%04d.jpg")
 
         try:
             cmd = [
-                "ffmpeg",
+                *FFMPEG_CMD,
+                *self._hwaccel_args(),
                 "-i", str(self.video_path),
-                "-vf", f"fps=1/{interval_seconds},scale=1280:-1",
+                "-an", "-sn", "-dn",
+                "-vf", f"fps=1/{interval_seconds},scale={DEFAULT_FRAME_WIDTH}:-1",
                 "-frames:v", str(max_frames),
-                "-q:v", "2",
+                *FFMPEG_JPEG_ARGS,
                 output_pattern
             ]
 
@@ -208,12 +616,11 @@ class VideoProcessor:
                 text=True
             )
 
-            # Get list of extracted frames
-            frame_files = sorted([
-                os.path.join(output_dir, f)
-                for f in os.listdir(output_dir)
-                if f.startswith("frame_") and f.endswith(".jpg")
-            ])
+            # Get list of extracted frames (ignores unrelated files in output_dir)
+            frame_files = sorted(
+                str(path)
+                for path in Path(output_dir).glob("frame_[0-9][0-9][0-9][0-9].jpg")
+            )
 
             return frame_files
 
@@ -223,7 +630,8 @@ class VideoProcessor:
     def get_thumbnail_at_time(
         self,
         timestamp: float,
-        output_path: str
+        output_path: str,
+        approximate: bool = True
     ) -> str:
         """
         Extract a single frame at a specific timestamp.
@@ -231,6 +639,9 @@ class VideoProcessor:
         Args:
             timestamp: Time in seconds
             output_path: Path to save the frame
+            approximate: Use the keyframe at or before the timestamp, which
+                only decodes one frame however deep the seek. False decodes
+                forward to the exact frame.
 
         Returns:
             Path to the extracted frame
@@ -238,11 +649,27 @@ class VideoProcessor:
         Raises:
             RuntimeError: If FFmpeg fails
         """
+        av = _load_av()
+        if av is not None:
+            try:
+                frame = self._decode_frame_at(timestamp, approximate=approximate)
+            except av.FFmpegError as e:
+                raise RuntimeError(f"PyAV failed to extract frame: {e}")
+            if frame is None:
+                raise RuntimeError(f"No frame found at {timestamp}s")
+
+            frame.to_image().save(output_path, quality=95)
+            return output_path
+
         try:
-            cmd = [
-                "ffmpeg",
+            cmd = list(FFMPEG_CMD)
+            if approximate:
+                cmd.append("-noaccurate_seek")
+            cmd += [
+                *self._hwaccel_args(),
                 "-ss", str(timestamp),
                 "-i", str(self.video_path),
+                "-an", "-sn", "-dn",
                 "-vframes", "1",
                 "-q:v", "2",
                 "-y",  # Overwrite output file
@@ -262,7 +689,13 @@ class VideoProcessor:
             raise RuntimeError(f"FFmpeg failed to extract frame: {e.stderr}")
 
     def cleanup(self):
-        """Clean up temporary files and directories."""
+        """Clean up temporary files and directories, and close the video."""
+        if self._container is not None:
+            self._container.close()
+            self._container = None
+            self._frames = None
+            self._position = None
+
         if self.temp_dir and os.path.exists(self.temp_dir):
             import shutil
             shutil.rmtree(self.temp_dir)
@@ -0,0 +1,93 @@
+"""Disk cache for Claude API responses keyed by content hash."""
+
+import os
+import json
+import hashlib
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+DEFAULT_CACHE_DIR = "~/.cache/autothumb"
+
+
+class ResponseCache:
+    """Store JSON-serializable API results on disk, keyed by a SHA-256 hash."""
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Initialize the response cache.
+
+        Args:
+            cache_dir: Cache directory (reads from AUTOTHUMB_CACHE_DIR env var,
+                defaults to ~/.cache/autothumb)
+        """
+        self.cache_dir = Path(
+            cache_dir or os.getenv("AUTOTHUMB_CACHE_DIR", DEFAULT_CACHE_DIR)
+        ).expanduser()
+        self._memory: Dict[str, Dict] = {}
+
+    @staticmethod
+    def make_key(*parts: str, file_paths: Optional[List[str]] = None) -> str:
+        """
+        Build a cache key from text arguments and file contents.
+
+        Args:
+            *parts: Text arguments that influence the result
+            file_paths: Files whose bytes influence the result (order matters)
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        digest = hashlib.sha256()
+
+        for file_path in file_paths or []:
+            with open(file_path, "rb") as f:
+                digest.update(hashlib.file_digest(f, "sha256").digest())
+
+        for part in parts:
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Look up a cached result.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Cached result, or None on miss
+        """
+        if key in self._memory:
+            return self._memory[key]
+
+        try:
+            with open(self.cache_dir / f"{key}.json", "r", encoding="utf-8") as f:
+                value = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+        self._memory[key] = value
+        return value
+
+    def set(self, key: str, value: Dict):
+        """
+        Store a result in memory and on disk.
+
+        Args:
+            key: Cache key from make_key()
+            value: JSON-serializable result
+        """
+        self._memory[key] = value
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_dir / f"{key}.json.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(value, f)
+            os.replace(tmp_path, self.cache_dir / f"{key}.json")
+        except OSError:
+            # Cache is best effort; a read-only home must not break generation
+            pass
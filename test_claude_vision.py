@@ -3,6 +3,7 @@
 
 import sys
 import os
+import asyncio
 from pathlib import Path
 
 # Add src to path
@@ -12,6 +13,105 @@ from autothumb.core.video import VideoProcessor
 from autothumb.core.analyzer import FrameAnalyzer
 
 
+async def _run_analysis(frames, video_description: str) -> bool:
+    """
+    Run the Claude tests (frame selection, text, combined) on one event loop.
+
+    The analyzer's HTTP connection pool is bound to the loop it first runs
+    on, so all calls share a single asyncio.run() and the client is closed
+    before that loop ends.
+    """
+    print("\n" + "=" * 60)
+    print("TEST 2: Analyse Claude Vision - Sélection de frame")
+    print("=" * 60)
+
+    try:
+        analyzer = FrameAnalyzer()
+    except Exception as e:
+        print(f"✗ Erreur lors de l'analyse: {e}")
+        return False
+
+    async with analyzer:
+        try:
+            print(f"✓ Analyseur Claude initialisé")
+            print(f"  Prompt: {video_description}")
+            print(f"\n⏳ Analyse en cours (cela peut prendre 10-30 secondes)...\n")
+
+            analysis = await analyzer.analyze_frames(frames, video_description)
+
+            print(f"✓ Analyse terminée !")
+            print(f"\n📊 Résultats:")
+            print(f"  Meilleure frame: #{analysis['best_frame_index'] + 1}")
+            print(f"  Fichier: {os.path.basename(analysis['best_frame_path'])}")
+            print(f"\n💡 Raisonnement de Claude:")
+            print(f"  {analysis['reasoning'][:300]}...")
+
+            if analysis['scores']:
+                print(f"\n📈 Scores des frames:")
+                for i, score_info in enumerate(analysis['scores'][:5], 1):
+                    score = score_info.get('score', 'N/A')
+                    print(f"  Frame {i}: {score}/10")
+
+        except Exception as e:
+            print(f"✗ Erreur lors de l'analyse: {e}")
+            import traceback
+            traceback.print_exc()
+            return False
+
+        print("\n" + "=" * 60)
+        print("TEST 3: Génération de texte pour thumbnail")
+        print("=" * 60)
+
+        try:
+            print(f"⏳ Génération du texte...\n")
+
+            text_result = await analyzer.generate_thumbnail_text(
+                video_description,
+                style="youtube",
+                max_words=6
+            )
+
+            print(f"✓ Texte généré !")
+            print(f"\n📝 Texte principal: \"{text_result['main_text']}\"")
+            if text_result.get('subtext'):
+                print(f"   Sous-texte: \"{text_result['subtext']}\"")
+            print(f"\n💡 Justification:")
+            print(f"  {text_result.get('reasoning', 'N/A')[:300]}...")
+
+        except Exception as e:
+            print(f"✗ Erreur lors de la génération: {e}")
+            import traceback
+            traceback.print_exc()
+            return False
+
+        print("\n" + "=" * 60)
+        print("TEST 4: Analyse complète (frame + texte)")
+        print("=" * 60)
+
+        try:
+            print(f"⏳ Analyse complète en cours...\n")
+
+            frame_analysis, text_gen = await analyzer.analyze_and_generate(
+                frames,
+                video_description,
+                style="bold",
+                max_words=5
+            )
+
+            print(f"✓ Analyse complète terminée !")
+            print(f"\n🎯 Résumé final:")
+            print(f"  Meilleure frame: {os.path.basename(frame_analysis['best_frame_path'])}")
+            print(f"  Texte suggéré: \"{text_gen['main_text']}\"")
+
+        except Exception as e:
+            print(f"✗ Erreur: {e}")
+            import traceback
+            traceback.print_exc()
+            return False
+
+        return True
+
+
 def test_claude_vision(video_path: str, video_description: str):
     """Test l'analyse Claude Vision sur une vidéo."""
 
@@ -37,86 +137,7 @@ def test_claude_vision(video_path: str, video_description: str):
     finally:
         processor.cleanup()
 
-    print("\n" + "=" * 60)
-    print("TEST 2: Analyse Claude Vision - Sélection de frame")
-    print("=" * 60)
-
-    try:
-        analyzer = FrameAnalyzer()
-        print(f"✓ Analyseur Claude initialisé")
-        print(f"  Prompt: {video_description}")
-        print(f"\n⏳ Analyse en cours (cela peut prendre 10-30 secondes)...\n")
-
-        analysis = analyzer.analyze_frames(frames, video_description)
-
-        print(f"✓ Analyse terminée !")
-        print(f"\n📊 Résultats:")
-        print(f"  Meilleure frame: #{analysis['best_frame_index'] + 1}")
-        print(f"  Fichier: {os.path.basename(analysis['best_frame_path'])}")
-        print(f"\n💡 Raisonnement de Claude:")
-        print(f"  {analysis['reasoning'][:300]}...")
-
-        if analysis['scores']:
-            print(f"\n📈 Scores des frames:")
-            for i, score_info in enumerate(analysis['scores'][:5], 1):
-                score = score_info.get('score', 'N/A')
-                print(f"  Frame {i}: {score}/10")
-
-    except Exception as e:
-        print(f"✗ Erreur lors de l'analyse: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-    print("\n" + "=" * 60)
-    print("TEST 3: Génération de texte pour thumbnail")
-    print("=" * 60)
-
-    try:
-        print(f"⏳ Génération du texte...\n")
-
-        text_result = analyzer.generate_thumbnail_text(
-            video_description,
-            style="youtube",
-            max_words=6
-        )
-
-        print(f"✓ Texte généré !")
-        print(f"\n📝 Texte principal: \"{text_result['main_text']}\"")
-        if text_result.get('subtext'):
-            print(f"   Sous-texte: \"{text_result['subtext']}\"")
-        print(f"\n💡 Justification:")
-        print(f"  {text_result.get('reasoning', 'N/A')[:300]}...")
-
-    except Exception as e:
-        print(f"✗ Erreur lors de la génération: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-    print("\n" + "=" * 60)
-    print("TEST 4: Analyse complète (frame + texte)")
-    print("=" * 60)
-
-    try:
-        print(f"⏳ Analyse complète en cours...\n")
-
-        frame_analysis, text_gen = analyzer.analyze_and_generate(
-            frames,
-            video_description,
-            style="bold",
-            max_words=5
-        )
-
-        print(f"✓ Analyse complète terminée !")
-        print(f"\n🎯 Résumé final:")
-        print(f"  Meilleure frame: {os.path.basename(frame_analysis['best_frame_path'])}")
-        print(f"  Texte suggéré: \"{text_gen['main_text']}\"")
-
-    except Exception as e:
-        print(f"✗ Erreur: {e}")
-        import traceback
-        traceback.print_exc()
+    if not asyncio.run(_run_analysis(frames, video_description)):
         return False
 
     print("\n" + "=" * 60)
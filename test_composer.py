@@ -1,102 +1,141 @@
 #!/usr/bin/env python3
 """Script de test pour la composition de thumbnails."""
 
+import os
 import sys
 from pathlib import Path
-import glob
+from concurrent.futures import ProcessPoolExecutor
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from autothumb.core.composer import ThumbnailComposer
+from autothumb.core.video import VideoProcessor
 
 
-def test_composer():
-    """Test la composition de thumbnails avec différents styles."""
+def _first_test_frame(frame_dir="./output/test_frames"):
+    """
+    Find one extracted test frame without listing the whole directory.
 
-    # Find test frames
-    frame_dir = "./output/test_frames"
-    frames = glob.glob(f"{frame_dir}/frame_*.jpg")
+    Returns:
+        Path to a frame, or None if there is none
+    """
+    try:
+        with os.scandir(frame_dir) as entries:
+            return next(
+                (entry.path for entry in entries
+                 if entry.name.startswith("frame_") and entry.name.endswith(".jpg")),
+                None
+            )
+    except FileNotFoundError:
+        return None
 
-    if not frames:
-        print("✗ Aucune frame trouvée. Exécutez d'abord test_video_extraction.py")
-        return False
 
-    test_frame = frames[0]
-    print("=" * 60)
-    print("TEST: Composition de thumbnails")
-    print("=" * 60)
-    print(f"Frame de test: {test_frame}\n")
+def _compose_style(style, test_frame):
+    """
+    Compose the two test thumbnails of one style (runs in a worker process).
 
-    styles = ["youtube", "minimalist", "bold", "tech"]
-    success_count = 0
+    Returns:
+        Tuple of (lines to print, number of thumbnails created)
+    """
+    lines = [f"📐 Test du style '{style}'..."]
+    created = 0
 
-    for style in styles:
-        print(f"📐 Test du style '{style}'...")
+    try:
+        composer = ThumbnailComposer(style=style)
 
-        try:
-            composer = ThumbnailComposer(style=style)
+        output_path = f"./output/thumbnail_{style}.jpg"
 
-            output_path = f"./output/thumbnail_{style}.jpg"
+        # Test with main text only
+        result = composer.compose(
+            image_path=test_frame,
+            main_text="Tutoriel Python Avancé",
+            output_path=output_path,
+            resolution=(1280, 720)
+        )
 
-            # Test with main text only
-            result = composer.compose(
-                image_path=test_frame,
-                main_text="Tutoriel Python Avancé",
-                output_path=output_path,
-                resolution=(1280, 720)
-            )
+        lines.append(f"  ✓ Thumbnail créé: {result}")
+        created += 1
+
+        # Test with subtext
+        output_path_sub = f"./output/thumbnail_{style}_subtext.jpg"
+        result_sub = composer.compose(
+            image_path=test_frame,
+            main_text="Maîtrisez Python",
+            subtext="En 30 minutes",
+            output_path=output_path_sub,
+            resolution=(1920, 1080)
+        )
 
-            print(f"  ✓ Thumbnail créé: {result}")
-            success_count += 1
-
-            # Test with subtext
-            output_path_sub = f"./output/thumbnail_{style}_subtext.jpg"
-            result_sub = composer.compose(
-                image_path=test_frame,
-                main_text="Maîtrisez Python",
-                subtext="En 30 minutes",
-                output_path=output_path_sub,
-                resolution=(1920, 1080)
-            )
+        lines.append(f"  ✓ Thumbnail avec sous-titre: {result_sub}")
+        created += 1
+
+    except Exception as e:
+        import traceback
+        lines.append(f"  ✗ Erreur: {e}")
+        lines.append(traceback.format_exc())
 
-            print(f"  ✓ Thumbnail avec sous-titre: {result_sub}")
-            success_count += 1
+    return lines, created
 
-        except Exception as e:
-            print(f"  ✗ Erreur: {e}")
-            import traceback
-            traceback.print_exc()
 
-        print()
+def _emit(lines):
+    """Write a whole section of output at once instead of line by line."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
-    print("=" * 60)
+
+def test_composer():
+    """Test la composition de thumbnails avec différents styles."""
+
+    # Find a test frame
+    test_frame = _first_test_frame()
+
+    if not test_frame:
+        _emit(["✗ Aucune frame trouvée. Exécutez d'abord test_video_extraction.py"])
+        return False
+
+    _emit([
+        "=" * 60,
+        "TEST: Composition de thumbnails",
+        "=" * 60,
+        f"Frame de test: {test_frame}\n",
+    ])
+
+    styles = ["youtube", "minimalist", "bold", "tech"]
+    success_count = 0
+
+    # Styles are independent and CPU-bound: compose them in parallel,
+    # each worker building its own composer
+    with ProcessPoolExecutor(max_workers=min(len(styles), os.cpu_count() or 1)) as executor:
+        results = executor.map(_compose_style, styles, [test_frame] * len(styles))
+
+        for lines, created in results:
+            _emit(lines + [""])
+            success_count += created
+
+    lines = ["=" * 60]
     if success_count == len(styles) * 2:
-        print("✓ TOUS LES TESTS PASSÉS")
-        print("=" * 60)
-        print("\n📂 Thumbnails générés dans ./output/:")
+        lines += ["✓ TOUS LES TESTS PASSÉS", "=" * 60, "\n📂 Thumbnails générés dans ./output/:"]
         for style in styles:
-            print(f"  - thumbnail_{style}.jpg (1280x720)")
-            print(f"  - thumbnail_{style}_subtext.jpg (1920x1080)")
+            lines.append(f"  - thumbnail_{style}.jpg (1280x720)")
+            lines.append(f"  - thumbnail_{style}_subtext.jpg (1920x1080)")
+        _emit(lines)
         return True
     else:
-        print(f"⚠ {success_count}/{len(styles) * 2} tests réussis")
-        print("=" * 60)
+        lines += [f"⚠ {success_count}/{len(styles) * 2} tests réussis", "=" * 60]
+        _emit(lines)
         return False
 
 
 def test_custom_style():
     """Test avec un style personnalisé."""
 
-    frame_dir = "./output/test_frames"
-    frames = glob.glob(f"{frame_dir}/frame_*.jpg")
+    test_frame = _first_test_frame()
 
-    if not frames:
+    if not test_frame:
         return True  # Skip if no frames
 
-    print("\n" + "=" * 60)
-    print("TEST BONUS: Style personnalisé")
-    print("=" * 60)
+    lines = ["\n" + "=" * 60, "TEST BONUS: Style personnalisé", "=" * 60]
 
     try:
         composer = ThumbnailComposer(style="youtube")
@@ -110,7 +149,7 @@ def test_custom_style():
         }
 
         result = composer.compose(
-            image_path=frames[0],
+            image_path=test_frame,
             main_text="Style Custom",
             subtext="Couleurs folles !",
             output_path="./output/thumbnail_custom.jpg",
@@ -118,16 +157,86 @@ def test_custom_style():
             custom_style=custom_style
         )
 
-        print(f"✓ Thumbnail personnalisé créé: {result}")
+        lines.append(f"✓ Thumbnail personnalisé créé: {result}")
+        _emit(lines)
+        return True
+
+    except Exception as e:
+        lines.append(f"✗ Erreur: {e}")
+        _emit(lines)
+        return False
+
+
+def test_multi_resolution():
+    """Test la génération en plusieurs résolutions depuis un seul rendu."""
+
+    test_frame = _first_test_frame()
+
+    if not test_frame:
+        return True  # Skip if no frames
+
+    lines = ["\n" + "=" * 60, "TEST BONUS: Plusieurs résolutions", "=" * 60]
+
+    try:
+        composer = ThumbnailComposer(style="bold")
+
+        results = composer.compose_multi_resolution(
+            image_path=test_frame,
+            main_text="Un rendu, deux tailles",
+            output_paths={
+                (1920, 1080): "./output/thumbnail_multi_1080p.jpg",
+                (1280, 720): "./output/thumbnail_multi_720p.jpg",
+            }
+        )
+
+        for (width, height), result in results.items():
+            lines.append(f"✓ {width}x{height}: {result}")
+        _emit(lines)
+        return True
+
+    except Exception as e:
+        lines.append(f"✗ Erreur: {e}")
+        _emit(lines)
+        return False
+
+
+def test_compose_from_video():
+    """Test la composition directe depuis la vidéo, sans frame sur disque."""
+
+    video_path = os.getenv("TEST_VIDEO_PATH")
+
+    if not video_path or not os.path.exists(video_path):
+        return True  # Skip if no video
+
+    lines = ["\n" + "=" * 60, "TEST BONUS: Frame en mémoire", "=" * 60]
+
+    try:
+        composer = ThumbnailComposer(style="youtube")
+
+        with VideoProcessor(video_path) as processor:
+            frame = processor.read_frame(processor.metadata["duration"] / 2)
+
+        result = composer.compose_image(
+            image=frame,
+            main_text="Frame en mémoire",
+            output_path="./output/thumbnail_from_video.jpg",
+            resolution=(1280, 720)
+        )
+
+        lines.append(f"✓ Thumbnail créé sans frame intermédiaire: {result}")
+        _emit(lines)
         return True
 
     except Exception as e:
-        print(f"✗ Erreur: {e}")
+        lines.append(f"✗ Erreur: {e}")
+        _emit(lines)
         return False
 
 
 if __name__ == "__main__":
     success1 = test_composer()
     success2 = test_custom_style()
+    success3 = test_multi_resolution()
+    success4 = test_compose_from_video()
 
-    sys.exit(0 if (success1 and success2) else 1)
+    sys.exit(0 if (success1 and success2 and success3 and success4) else 1)
@@ -10,47 +10,58 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 from autothumb.core.video import VideoProcessor
 
 
+def _emit(lines):
+    """Write a whole section of output at once instead of line by line."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def _header(title, leading_newline=True):
+    """Build the banner lines of a test section."""
+    return [("\n" if leading_newline else "") + "=" * 60, title, "=" * 60]
+
+
 def test_video_extraction(video_path: str):
     """Test l'extraction de frames d'une vidéo."""
 
-    print("=" * 60)
-    print("TEST 1: Chargement de la vidéo et métadonnées")
-    print("=" * 60)
+    lines = _header("TEST 1: Chargement de la vidéo et métadonnées", leading_newline=False)
 
     try:
         processor = VideoProcessor(video_path)
-        print(f"✓ Vidéo chargée: {video_path}")
-        print(f"\nMétadonnées:")
-        print(f"  - Durée: {processor.metadata['duration']:.2f} secondes")
-        print(f"  - Résolution: {processor.metadata['width']}x{processor.metadata['height']}")
-        print(f"  - FPS: {processor.metadata['fps']:.2f}")
-        print(f"  - Codec: {processor.metadata['codec']}")
-        print(f"  - Bitrate: {processor.metadata['bitrate']} bits/s")
+        lines += [
+            f"✓ Vidéo chargée: {video_path}",
+            f"\nMétadonnées:",
+            f"  - Durée: {processor.metadata['duration']:.2f} secondes",
+            f"  - Résolution: {processor.metadata['width']}x{processor.metadata['height']}",
+            f"  - FPS: {processor.metadata['fps']:.2f}",
+            f"  - Codec: {processor.metadata['codec']}",
+            f"  - Bitrate: {processor.metadata['bitrate']} bits/s",
+        ]
 
     except Exception as e:
-        print(f"✗ Erreur lors du chargement: {e}")
+        lines.append(f"✗ Erreur lors du chargement: {e}")
+        _emit(lines)
         return False
 
-    print("\n" + "=" * 60)
-    print("TEST 2: Extraction de 5 frames")
-    print("=" * 60)
+    _emit(lines)
+    lines = _header("TEST 2: Extraction de 5 frames")
 
     try:
         frames = processor.extract_frames(num_frames=5, output_dir="./output/test_frames")
-        print(f"✓ {len(frames)} frames extraites")
+        lines.append(f"✓ {len(frames)} frames extraites")
 
         for i, frame_path in enumerate(frames, 1):
-            print(f"  Frame {i}: {frame_path}")
+            lines.append(f"  Frame {i}: {frame_path}")
 
     except Exception as e:
-        print(f"✗ Erreur lors de l'extraction: {e}")
+        lines.append(f"✗ Erreur lors de l'extraction: {e}")
+        _emit(lines)
         return False
     finally:
         processor.cleanup()
 
-    print("\n" + "=" * 60)
-    print("TEST 3: Extraction à intervalle régulier (1 frame/2s)")
-    print("=" * 60)
+    _emit(lines)
+    lines = _header("TEST 3: Extraction à intervalle régulier (1 frame/2s)")
 
     try:
         processor2 = VideoProcessor(video_path)
@@ -59,38 +70,41 @@ def test_video_extraction(video_path: str):
             max_frames=10,
             output_dir="./output/test_frames_interval"
         )
-        print(f"✓ {len(frames)} frames extraites")
+        lines.append(f"✓ {len(frames)} frames extraites")
 
         for i, frame_path in enumerate(frames, 1):
-            print(f"  Frame {i}: {frame_path}")
+            lines.append(f"  Frame {i}: {frame_path}")
 
         processor2.cleanup()
 
     except Exception as e:
-        print(f"✗ Erreur: {e}")
+        lines.append(f"✗ Erreur: {e}")
+        _emit(lines)
         return False
 
-    print("\n" + "=" * 60)
-    print("✓ TOUS LES TESTS PASSÉS")
-    print("=" * 60)
-    print(f"\nVous pouvez maintenant vérifier les images dans:")
-    print(f"  - ./output/test_frames/")
-    print(f"  - ./output/test_frames_interval/")
+    _emit(lines)
+    _emit(_header("✓ TOUS LES TESTS PASSÉS") + [
+        f"\nVous pouvez maintenant vérifier les images dans:",
+        f"  - ./output/test_frames/",
+        f"  - ./output/test_frames_interval/",
+    ])
 
     return True
 
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
-        print("Usage: python test_video_extraction.py <chemin_video>")
-        print("\nExemple:")
-        print("  python test_video_extraction.py ./videos/ma_video.mp4")
+        _emit([
+            "Usage: python test_video_extraction.py <chemin_video>",
+            "\nExemple:",
+            "  python test_video_extraction.py ./videos/ma_video.mp4",
+        ])
         sys.exit(1)
 
     video_path = sys.argv[1]
 
     if not Path(video_path).exists():
-        print(f"✗ Erreur: Le fichier '{video_path}' n'existe pas")
+        _emit([f"✗ Erreur: Le fichier '{video_path}' n'existe pas"])
         sys.exit(1)
 
     success = test_video_extraction(video_path)
@@ -0,0 +1,64 @@
+"""Shared fixtures for the test suite."""
+
+import os
+import pytest
+from autothumb.core.video import VideoProcessor
+
+
+# pytest cache entry holding the probed metadata of TEST_VIDEO_PATH
+METADATA_CACHE_KEY = "autothumb/video_metadata"
+
+
+@pytest.fixture(scope="session")
+def sample_video():
+    """
+    Fixture providing path to a sample video.
+
+    Note: In real tests, you would need an actual video file.
+    For CI/CD, you might generate a test video or download one.
+    """
+    # This is a placeholder - in real tests you'd need an actual video
+    video_path = os.getenv("TEST_VIDEO_PATH")
+
+    if video_path and os.path.exists(video_path):
+        return video_path
+
+    pytest.skip("No test video available. Set TEST_VIDEO_PATH environment variable.")
+
+
+@pytest.fixture(scope="session")
+def sample_metadata(request, sample_video):
+    """
+    Fixture providing the sample video's metadata, probed once across runs.
+
+    The result is kept in .pytest_cache, keyed by the video's path, size
+    and modification time, so FFprobe only runs again when the file changes.
+    """
+    stat = os.stat(sample_video)
+    key = [os.path.abspath(sample_video), stat.st_mtime_ns, stat.st_size]
+
+    # The cache is absent when pytest runs with -p no:cacheprovider
+    cache = getattr(request.config, "cache", None)
+    if cache is None:
+        return VideoProcessor(sample_video).metadata
+
+    cached = cache.get(METADATA_CACHE_KEY, None)
+    if cached and cached.get("key") == key:
+        return cached["metadata"]
+
+    metadata = VideoProcessor(sample_video).metadata
+    cache.set(METADATA_CACHE_KEY, {"key": key, "metadata": metadata})
+    return metadata
+
+
+@pytest.fixture(scope="module")
+def processor(sample_video, sample_metadata):
+    """
+    Fixture providing one VideoProcessor shared by the module's tests.
+
+    Built from the cached metadata; tests that rely on the processor's
+    own temp dir create their own instance instead.
+    """
+    processor = VideoProcessor(sample_video, metadata=sample_metadata)
+    yield processor
+    processor.cleanup()
@@ -0,0 +1,197 @@
+"""Tests for frame analyzer helpers."""
+
+import asyncio
+import json
+import pytest
+from autothumb.core import analyzer as analyzer_module
+from autothumb.core.analyzer import FrameAnalyzer, _extract_json
+
+try:
+    import httpx
+except ImportError:
+    # anthropic releases built on httpx2
+    import httpx2 as httpx
+
+
+def _sse(event_type: str, data: dict) -> bytes:
+    """Encode one server-sent event."""
+    return f"event: {event_type}\ndata: {json.dumps(data)}\n\n".encode()
+
+
+_STREAM_START = [
+    _sse("message_start", {
+        "type": "message_start",
+        "message": {
+            "id": "msg_test", "type": "message", "role": "assistant", "model": "test-model",
+            "content": [], "stop_reason": None, "stop_sequence": None,
+            "usage": {"input_tokens": 1, "output_tokens": 1},
+        },
+    }),
+    _sse("content_block_start", {
+        "type": "content_block_start", "index": 0,
+        "content_block": {"type": "text", "text": ""},
+    }),
+    _sse("content_block_delta", {
+        "type": "content_block_delta", "index": 0,
+        "delta": {"type": "text_delta", "text": "Hello"},
+    }),
+]
+
+_STREAM_END = [
+    _sse("content_block_delta", {
+        "type": "content_block_delta", "index": 0,
+        "delta": {"type": "text_delta", "text": " world"},
+    }),
+    _sse("content_block_stop", {"type": "content_block_stop", "index": 0}),
+    _sse("message_delta", {
+        "type": "message_delta",
+        "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+        "usage": {"output_tokens": 2},
+    }),
+    _sse("message_stop", {"type": "message_stop"}),
+]
+
+_OVERLOADED = _sse("error", {
+    "type": "error",
+    "error": {"type": "overloaded_error", "message": "Overloaded"},
+})
+
+
+class _DroppedStream(httpx.AsyncByteStream):
+    """Response body that breaks after the first events."""
+
+    async def __aiter__(self):
+        for chunk in _STREAM_START:
+            yield chunk
+        raise httpx.ReadError("connection dropped")
+
+
+def _analyzer_with_responses(responses, max_retries=2):
+    """
+    Build an analyzer whose HTTP requests get the given responses in order.
+
+    Returns:
+        Tuple of (analyzer, list of received requests)
+    """
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        body = responses[len(requests) - 1]
+        headers = {"content-type": "text/event-stream"}
+        if isinstance(body, httpx.AsyncByteStream):
+            return httpx.Response(200, headers=headers, stream=body)
+        return httpx.Response(200, headers=headers, content=b"".join(body))
+
+    analyzer = FrameAnalyzer(api_key="test-key", use_cache=False, max_retries=max_retries)
+    analyzer.client = analyzer.client.with_options(
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+    return analyzer, requests
+
+
+async def _stream_text(analyzer):
+    """Run one streamed request and close the client."""
+    async with analyzer:
+        return await analyzer._create_message(
+            model="test-model",
+            max_tokens=16,
+            messages=[{"role": "user", "content": "hi"}]
+        )
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    """Fixture removing the retry delay."""
+    monkeypatch.setattr(analyzer_module, "RETRY_BASE_DELAY", 0)
+    monkeypatch.setattr(analyzer_module.random, "random", lambda: 0.0)
+
+
+class TestCreateMessageRetries:
+    """Test retries of failures that happen after the stream opened."""
+
+    def test_overloaded_event_is_retried(self, no_backoff):
+        """Test an overloaded_error event mid-stream is retried."""
+        analyzer, requests = _analyzer_with_responses([
+            _STREAM_START + [_OVERLOADED],
+            _STREAM_START + _STREAM_END,
+        ])
+
+        assert asyncio.run(_stream_text(analyzer)) == "Hello world"
+        assert len(requests) == 2
+
+    def test_dropped_connection_is_retried(self, no_backoff):
+        """Test a transport error while reading the stream is retried."""
+        analyzer, requests = _analyzer_with_responses([
+            _DroppedStream(),
+            _STREAM_START + _STREAM_END,
+        ])
+
+        assert asyncio.run(_stream_text(analyzer)) == "Hello world"
+        assert len(requests) == 2
+
+    def test_dropped_connection_gives_up(self, no_backoff):
+        """Test the error is raised once the retry budget is spent."""
+        analyzer, requests = _analyzer_with_responses(
+            [_DroppedStream(), _DroppedStream()],
+            max_retries=1
+        )
+
+        with pytest.raises(httpx.ReadError):
+            asyncio.run(_stream_text(analyzer))
+        assert len(requests) == 2
+
+
+class TestExtractJson:
+    """Test extraction of the JSON object from Claude responses."""
+
+    def test_plain_object(self):
+        """Test a response that is only JSON."""
+        assert _extract_json('{"best_frame_index": 2}') == {"best_frame_index": 2}
+
+    def test_fenced_json(self):
+        """Test JSON inside a markdown code fence."""
+        text = 'Here is the analysis:\n```json\n{"main_text": "Hello", "subtext": ""}\n```\n'
+
+        assert _extract_json(text) == {"main_text": "Hello", "subtext": ""}
+
+    def test_surrounding_prose(self):
+        """Test prose before and after the object."""
+        text = 'Sure! {"score": 8, "frames": [{"index": 0}]} Let me know if you need more.'
+
+        assert _extract_json(text) == {"score": 8, "frames": [{"index": 0}]}
+
+    def test_braces_in_prose_before_json(self):
+        """Test stray braces in prose are skipped."""
+        text = 'Use a {placeholder} here. {"main_text": "Go"}'
+
+        assert _extract_json(text) == {"main_text": "Go"}
+
+    def test_braces_inside_strings(self):
+        """Test braces inside JSON strings don't end the object early."""
+        text = '{"reasoning": "curly } and { braces", "best_frame_index": 1}'
+
+        assert _extract_json(text) == {
+            "reasoning": "curly } and { braces",
+            "best_frame_index": 1,
+        }
+
+    def test_escaped_quotes(self):
+        """Test escaped quotes and backslashes inside strings."""
+        text = r'{"main_text": "Say \"hi\" {now}", "path": "C:\\dir\\"} trailing'
+
+        assert _extract_json(text) == {"main_text": 'Say "hi" {now}', "path": "C:\\dir\\"}
+
+    def test_first_object_wins(self):
+        """Test only the first complete object is returned."""
+        assert _extract_json('{"a": 1} {"b": 2}') == {"a": 1}
+
+    def test_no_json(self):
+        """Test responses without a JSON object return None."""
+        assert _extract_json("I could not analyze these frames.") is None
+        assert _extract_json("") is None
+        assert _extract_json("[1, 2, 3]") is None
+
+    def test_unbalanced_json(self):
+        """Test a truncated object returns None."""
+        assert _extract_json('Result: {"main_text": "Hello", "subtext": ') is None
@@ -0,0 +1,99 @@
+"""Tests for the API response cache."""
+
+import json
+import os
+import pytest
+from autothumb.utils import cache as cache_module
+from autothumb.utils.cache import ResponseCache
+
+
+@pytest.fixture
+def frame_file(tmp_path):
+    """Fixture providing a small file standing in for a frame."""
+    path = tmp_path / "frame_0001.jpg"
+    path.write_bytes(b"\xff\xd8fake jpeg bytes\xff\xd9")
+    return str(path)
+
+
+class TestMakeKey:
+    """Test cache key construction."""
+
+    def test_same_inputs_same_key(self, frame_file):
+        """Test that identical files and parameters give the same key."""
+        key1 = ResponseCache.make_key("analyze_frames", "model-a", "prompt", file_paths=[frame_file])
+        key2 = ResponseCache.make_key("analyze_frames", "model-a", "prompt", file_paths=[frame_file])
+
+        assert key1 == key2
+
+    def test_key_follows_file_content(self, frame_file, tmp_path):
+        """Test that a copy of a file gives the same key, new content a new one."""
+        copy = tmp_path / "copy.jpg"
+        copy.write_bytes(open(frame_file, "rb").read())
+        key = ResponseCache.make_key("analyze_frames", "model-a", "prompt", file_paths=[frame_file])
+
+        assert ResponseCache.make_key(
+            "analyze_frames", "model-a", "prompt", file_paths=[str(copy)]
+        ) == key
+
+        copy.write_bytes(b"other bytes")
+        assert ResponseCache.make_key(
+            "analyze_frames", "model-a", "prompt", file_paths=[str(copy)]
+        ) != key
+
+    def test_different_model_or_prompt(self, frame_file):
+        """Test that changing the model or the prompt changes the key."""
+        key = ResponseCache.make_key("analyze_frames", "model-a", "prompt", file_paths=[frame_file])
+
+        assert ResponseCache.make_key(
+            "analyze_frames", "model-b", "prompt", file_paths=[frame_file]
+        ) != key
+        assert ResponseCache.make_key(
+            "analyze_frames", "model-a", "other prompt", file_paths=[frame_file]
+        ) != key
+
+    def test_part_boundaries(self):
+        """Test that parts are delimited, not just concatenated."""
+        assert ResponseCache.make_key("ab", "c") != ResponseCache.make_key("a", "bc")
+
+
+class TestResponseCache:
+    """Test cache storage."""
+
+    def test_round_trip(self, tmp_path):
+        """Test that a stored value is found again, also by a new instance."""
+        cache = ResponseCache(str(tmp_path))
+        key = ResponseCache.make_key("text", "model-a")
+        value = {"main_text": "Hello", "subtext": "", "scores": [1, 2]}
+
+        cache.set(key, value)
+
+        assert cache.get(key) == value
+        assert ResponseCache(str(tmp_path)).get(key) == value
+
+    def test_miss(self, tmp_path):
+        """Test that an unknown key returns None."""
+        assert ResponseCache(str(tmp_path)).get("missing") is None
+
+    def test_corrupt_file(self, tmp_path):
+        """Test that an unreadable cache entry is treated as a miss."""
+        (tmp_path / "broken.json").write_text("{not json", encoding="utf-8")
+
+        assert ResponseCache(str(tmp_path)).get("broken") is None
+
+    def test_atomic_write(self, tmp_path, monkeypatch):
+        """Test that entries are written via a temp file and never left partial."""
+        cache = ResponseCache(str(tmp_path))
+        cache.set("key", {"value": 1})
+
+        assert os.listdir(tmp_path) == ["key.json"]
+        with open(tmp_path / "key.json", encoding="utf-8") as f:
+            assert json.load(f) == {"value": 1}
+
+        # A failed rename keeps the previous entry intact and does not raise
+        def failing_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(cache_module.os, "replace", failing_replace)
+        cache.set("key", {"value": 2})
+
+        assert ResponseCache(str(tmp_path)).get("key") == {"value": 1}
@@ -0,0 +1,58 @@
+"""Tests for thumbnail composition module."""
+
+import pytest
+from PIL import Image, ImageChops
+from autothumb.core.composer import ThumbnailComposer
+
+
+@pytest.fixture
+def frame_path(tmp_path):
+    """Fixture providing a 1080p JPEG frame with some structure."""
+    gradient = Image.linear_gradient("L").resize((1920, 1080))
+    image = Image.merge("RGB", (gradient, gradient.transpose(Image.Transpose.ROTATE_180), gradient))
+    path = tmp_path / "frame.jpg"
+    image.save(path, quality=95)
+    return str(path)
+
+
+def _same_pixels(path_a, path_b):
+    """Check two images are pixel-identical."""
+    with Image.open(path_a) as a, Image.open(path_b) as b:
+        return a.size == b.size and ImageChops.difference(a, b).getbbox() is None
+
+
+class TestComposeMultiResolution:
+    """Test ThumbnailComposer.compose_multi_resolution."""
+
+    def test_mixed_aspect_ratios(self, frame_path, tmp_path):
+        """Test each aspect ratio is laid out on its own, never stretched."""
+        composer = ThumbnailComposer(style="youtube")
+        output_paths = {
+            (1920, 1080): str(tmp_path / "multi_1080p.jpg"),
+            (1280, 720): str(tmp_path / "multi_720p.jpg"),
+            (720, 1280): str(tmp_path / "multi_vertical.jpg"),
+        }
+
+        results = composer.compose_multi_resolution(
+            frame_path, "Un rendu", output_paths, subtext="trois tailles"
+        )
+
+        assert results == output_paths
+        for (width, height), path in results.items():
+            with Image.open(path) as image:
+                assert image.size == (width, height)
+
+        # The vertical size gets the same layout as a direct compose() call,
+        # and the largest size of each ratio is the master itself
+        for resolution in [(720, 1280), (1920, 1080)]:
+            reference = str(tmp_path / f"compose_{resolution[0]}x{resolution[1]}.jpg")
+            composer.compose(
+                frame_path, "Un rendu", reference,
+                subtext="trois tailles", resolution=resolution
+            )
+            assert _same_pixels(results[resolution], reference)
+
+    def test_no_output(self, frame_path):
+        """Test an empty size mapping is rejected."""
+        with pytest.raises(ValueError):
+            ThumbnailComposer().compose_multi_resolution(frame_path, "Texte", {})
@@ -4,6 +4,7 @@ import os
 import tempfile
 import pytest
 from pathlib import Path
+from autothumb.core import video as video_module
 from autothumb.core.video import VideoProcessor
 
 
@@ -17,6 +18,7 @@ class TestVideoProcessor:
 
     def test_metadata_structure(self, sample_video):
         """Test that metadata has expected structure."""
+        # Probe for real: the shared processor's metadata may come from cache
         processor = VideoProcessor(sample_video)
 
         assert "duration" in processor.metadata
@@ -53,10 +55,9 @@ class TestVideoProcessor:
                 assert os.path.exists(frame_path)
                 assert frame_path.endswith(".jpg")
 
-    def test_extract_frames_with_custom_output(self, sample_video):
+    def test_extract_frames_with_custom_output(self, processor):
         """Test frame extraction to custom output directory."""
         with tempfile.TemporaryDirectory() as temp_dir:
-            processor = VideoProcessor(sample_video)
             frames = processor.extract_frames(
                 num_frames=3,
                 output_dir=temp_dir
@@ -78,13 +79,85 @@ class TestVideoProcessor:
             assert len(frames) <= 5
             assert len(frames) > 0
 
-    def test_get_thumbnail_at_time(self, sample_video):
+    @pytest.mark.parametrize("use_av", [True, False])
+    def test_extract_frames_interval_longer_than_video(self, sample_video, monkeypatch, use_av):
+        """Test an interval longer than the video gives one frame with either backend."""
+        if not use_av:
+            monkeypatch.setattr(video_module, "_load_av", lambda: None)
+
+        with VideoProcessor(sample_video) as processor:
+            frames = processor.extract_frames_interval(
+                interval_seconds=processor.metadata["duration"] * 3
+            )
+
+            assert len(frames) == 1
+            assert os.path.exists(frames[0])
+
+    def test_extract_frames_batch(self, sample_video):
+        """Test extracting frames at explicit timestamps."""
+        with VideoProcessor(sample_video) as processor:
+            frames = processor.extract_frames_batch([3.0, 1.0, 2.0, 1.0])
+
+            # Duplicates are dropped, files are numbered in time order
+            assert len(frames) == 3
+            assert frames == sorted(frames)
+            for frame_path in frames:
+                assert os.path.exists(frame_path)
+
+    @pytest.mark.parametrize("use_av", [True, False])
+    def test_extract_frames_batch_empty(self, processor, monkeypatch, use_av):
+        """Test an empty timestamp list is rejected the same way by either backend."""
+        if not use_av:
+            monkeypatch.setattr(video_module, "_load_av", lambda: None)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with pytest.raises(ValueError):
+                processor.extract_frames_batch([], output_dir=temp_dir)
+
+    def test_extract_frames_without_hw_accel(self, sample_video):
+        """Test extracting frames with software decoding only."""
+        with VideoProcessor(sample_video, hw_accel=False) as processor:
+            frames = processor.extract_frames(num_frames=2)
+
+            assert len(frames) == 2
+            for frame_path in frames:
+                assert os.path.exists(frame_path)
+
+    def test_hw_accel_falls_through_to_next_device(self, sample_video, monkeypatch):
+        """Test a hardware device that fails to open is skipped for the next one."""
+        av = pytest.importorskip("av")
+        hwaccel = pytest.importorskip("av.codec.hwaccel")
+
+        attempts = []
+        hw_containers = []
+        real_open = av.open
+
+        def fake_open(path, hwaccel=None):
+            if hwaccel is None:
+                return real_open(path)
+            attempts.append(hwaccel)
+            if len(attempts) == 1:
+                # First device type is supported by FFmpeg but absent here
+                raise av.FFmpegError(1, "Operation not permitted")
+            hw_containers.append(real_open(path))
+            return hw_containers[-1]
+
+        monkeypatch.setattr(hwaccel, "hwdevices_available", lambda: ["cuda", "vaapi"])
+        monkeypatch.setattr(av, "open", fake_open)
+
+        with VideoProcessor(sample_video) as processor:
+            container = processor._open_container()
+
+            # Second device type was tried and kept, no software reopen
+            assert len(attempts) == 2
+            assert hw_containers == [container]
+
+    def test_get_thumbnail_at_time(self, processor):
         """Test extracting single frame at specific time."""
         with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as tmp:
             output_path = tmp.name
 
         try:
-            processor = VideoProcessor(sample_video)
             result = processor.get_thumbnail_at_time(1.0, output_path)
 
             assert result == output_path
@@ -95,29 +168,18 @@ class TestVideoProcessor:
             if os.path.exists(output_path):
                 os.unlink(output_path)
 
-    def test_repr(self, sample_video):
+    def test_read_frame(self, processor):
+        """Test decoding a frame into memory."""
+        image = processor.read_frame(1.0)
+
+        assert image.mode == "RGB"
+        assert image.width == 1280
+
+    def test_repr(self, processor):
         """Test string representation."""
-        processor = VideoProcessor(sample_video)
         repr_str = repr(processor)
 
         assert "VideoProcessor" in repr_str
         assert "duration" in repr_str
         assert "resolution" in repr_str
 
-
-# Fixtures
-@pytest.fixture
-def sample_video():
-    """
-    Fixture providing path to a sample video.
-
-    Note: In real tests, you would need an actual video file.
-    For CI/CD, you might generate a test video or download one.
-    """
-    # This is a placeholder - in real tests you'd need an actual video
-    video_path = os.getenv("TEST_VIDEO_PATH")
-
-    if video_path and os.path.exists(video_path):
-        return video_path
-
-    pytest.skip("No test video available. Set TEST_VIDEO_PATH environment variable.")